@@ -5,9 +5,18 @@ from PyQt5.QtGui import QPixmap, QImage
 import threading
 import queue
 import sys
+import os
+import contextlib
+import json
+import hashlib
+import time
+import collections
+import csv
 import random
-import operator
-from PIL import Image
+import itertools
+import functools
+import math
+from PIL import Image, ImageDraw
 
 class ConsoleStream(QObject):
     outputWritten = pyqtSignal(str)
@@ -19,6 +28,34 @@ class ConsoleStream(QObject):
         pass
 
 
+class RenderQueue(QObject):
+    """
+    Hands render requests from the game thread to the GUI thread.
+    Only the newest request per target ("main" or a (row, col) slot) is kept, and the
+    signal is only sent when the queue was empty, so a burst of updates between two
+    repaints is painted once.
+    """
+    renderRequested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.pending = {}
+
+    def put(self, target, payload):
+        with self.lock:
+            notify = not self.pending
+            self.pending[target] = payload
+        if notify:
+            self.renderRequested.emit()
+
+    def take(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+        return pending
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -59,10 +96,15 @@ class MainWindow(QMainWindow):
         self.grid_layout.setSpacing(5)
 
         self.rectangles = {}
+        # What each slot was last asked to show, and scaled card pixmaps by (path, width, height)
+        self.slot_images = {}
+        self.card_pixmaps = {}
+        # Every card face comes out of one pre-scaled atlas image
+        self.card_atlas, self.card_atlas_rects = load_card_atlas()
         for row in range(5):
             for col in range(10):
                 label = QLabel(self)
-                label.setFixedSize(67, 97)
+                label.setFixedSize(card_slot_size[0], card_slot_size[1])
                 label.setStyleSheet("background-color: white;")
                 label.setAlignment(Qt.AlignCenter)
                 self.rectangles[(row, col)] = label
@@ -84,6 +126,10 @@ class MainWindow(QMainWindow):
 
         self.input_queue = queue.Queue()
 
+        # Rendering requests from the game thread are painted on the GUI thread
+        self.render_queue = RenderQueue()
+        self.render_queue.renderRequested.connect(self.flush_render_queue)
+
         self.program_thread = threading.Thread(target=self.run_program)
         self.program_thread.daemon = True
         self.program_thread.start()
@@ -116,1095 +162,621 @@ class MainWindow(QMainWindow):
         """
         Change the image displayed in the main image label.
         Accepts either a file path (str) or a PIL.Image object.
+        Safe to call from the game thread, the frame is painted by the GUI thread.
         """
+        self.render_queue.put("main", image_input)
+
+    def flush_render_queue(self):
+        for target, payload in self.render_queue.take().items():
+            if target == "main":
+                self.paint_main_image(payload)
+            else:
+                self.paint_rectangle_image(target[0], target[1], payload)
+
+    def paint_main_image(self, image_input):
+        # Compositor frames are redrawn in place, so hold their lock while Qt reads them
+        frame_lock = getattr(image_input, "frame_lock", None) or contextlib.nullcontext()
+        with render_stats.timer("change_main_image"), frame_lock:
+            self.draw_main_image(image_input)
+
+    def draw_main_image(self, image_input):
         if isinstance(image_input, str):
             # If input is a file path
-            image = QImage(image_input)
+            with render_stats.timer("decode"):
+                image = QImage(image_input)
         elif isinstance(image_input, Image.Image):
             # If input is a PIL.Image object, convert it to a QImage
-            image_data = image_input.tobytes("raw", "RGBA")
-            image = QImage(image_data, image_input.width, image_input.height, QImage.Format_RGBA8888)
+            frame_buffer = getattr(image_input, "frame_buffer", None)
+            with render_stats.timer("convert"):
+                if frame_buffer is not None:
+                    # Compositor frames share their pixels with a bytearray, so Qt can wrap it
+                    # without a tobytes() copy. Keep a reference while the QImage points at it.
+                    self.frame_buffer = frame_buffer
+                    image = QImage(frame_buffer, image_input.width, image_input.height, image_input.width * 4, QImage.Format_RGBA8888)
+                else:
+                    image_data = image_input.tobytes("raw", "RGBA")
+                    image = QImage(image_data, image_input.width, image_input.height, QImage.Format_RGBA8888)
         else:
             print("Error: Invalid image input. Must be a file path or PIL.Image object.")
             return
     
         if not image.isNull():
-            scaled_image = image.scaled(self.main_image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.main_image_label.setPixmap(QPixmap.fromImage(scaled_image))
+            # Frames composited at display size already fit, so only rescale the rest
+            label_size = self.main_image_label.size()
+            if image.size().scaled(label_size, Qt.KeepAspectRatio) != image.size():
+                with render_stats.timer("scale"):
+                    image = image.scaled(label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            with render_stats.timer("convert"):
+                pixmap = QPixmap.fromImage(image)
+            self.main_image_label.setPixmap(pixmap)
         else:
             print("Warning: Could not load the image.")
 
 
+    def main_image_size(self):
+        return (self.main_image_label.width(), self.main_image_label.height())
+
     def change_rectangle_image(self, row, col, image_path):
         """
         Change the image of a rectangle at (row, col) to the specified image dynamically.
+        Safe to call from the game thread, the slot is painted by the GUI thread.
+        Slots that already show image_path are skipped.
         """
+        if self.slot_images.get((row, col)) == image_path:
+            return
+        self.slot_images[(row, col)] = image_path
+        self.render_queue.put((row, col), image_path)
+
+    def paint_rectangle_image(self, row, col, image_path):
         label = self.rectangles.get((row, col))
         if label:
-            image = QImage(image_path)
-            if not image.isNull():
-                scaled_image = image.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                label.setPixmap(QPixmap.fromImage(scaled_image))
+            with render_stats.timer("change_rectangle_image"):
+                pixmap = self.card_pixmap(image_path, label.size())
+            if pixmap is not None:
+                label.setPixmap(pixmap)
             else:
                 print(f"Warning: Could not load image at {image_path}")
 
+    def card_pixmap(self, image_path, size):
+        key = (image_path, size.width(), size.height())
+        pixmap = self.card_pixmaps.get(key)
+        if pixmap is None:
+            card = os.path.splitext(os.path.basename(image_path))[0]
+            rect = self.card_atlas_rects.get(card)
+            if (rect is not None) and (key[1:] == card_slot_size):
+                with render_stats.timer("convert"):
+                    pixmap = self.card_atlas.copy(rect[0], rect[1], rect[2], rect[3])
+                self.card_pixmaps[key] = pixmap
+                return pixmap
+            with render_stats.timer("decode"):
+                image = QImage(image_path)
+            if image.isNull():
+                return None
+            with render_stats.timer("scale"):
+                scaled_image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            with render_stats.timer("convert"):
+                pixmap = QPixmap.fromImage(scaled_image)
+            self.card_pixmaps[key] = pixmap
+        return pixmap
 
-    
 
+class RenderStats:
+    """
+    Optional wall clock timings for the render path, off until switched on with the
+    hidden RT option. timer(name) wraps a whole call (showspace, fill_inventory, ...)
+    or one phase of it (decode, composite, convert, scale), and the newest samples per
+    name are kept for p50/p95/max. While off it returns one shared null context, so the
+    instrumented code only pays for a flag check.
+    """
+    def __init__(self, samples=1000):
+        self.enabled = False
+        self.samples = samples
+        self.timings = {}
+        self.lock = threading.Lock()
+        self.idle = contextlib.nullcontext()
 
+    def timer(self, name):
+        if not self.enabled:
+            return self.idle
+        return self.timed(name)
 
+    @contextlib.contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
 
+    def record(self, name, milliseconds):
+        with self.lock:
+            samples = self.timings.get(name)
+            if samples is None:
+                samples = collections.deque(maxlen=self.samples)
+                self.timings[name] = samples
+            samples.append(milliseconds)
 
+    def reset(self):
+        with self.lock:
+            self.timings = {}
 
-def level_check(inventory, level_list, bonus_coin_count, money):
-    options = []
-    possible_levels = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 
-                       71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142]
-    for levels in level_list:
-        opt = 0
-        for opts in possible_levels:
-            if opts == levels:
-                possible_levels.pop(opt)
-            opt += 1
-    
-    for levels in possible_levels:
-        materials = material_list[levels-1]
-        m_test = True
-        money_test = False
-        for req in materials:
-            if req in inventory:
+    def rows(self):
+        # (name, count, p50, p95, max) in milliseconds
+        with self.lock:
+            snapshot = {name: sorted(samples) for name, samples in self.timings.items()}
+        rows = []
+        for name in sorted(snapshot):
+            samples = snapshot[name]
+            count = len(samples)
+            rows.append((name, count, samples[count // 2], samples[min(count - 1, int(count * 0.95))], samples[-1]))
+        return rows
+
+    def report(self):
+        rows = self.rows()
+        if not rows:
+            return "Render timings: no samples yet"
+        lines = ["{:<22}{:>7}{:>10}{:>10}{:>10}".format("Render timings (ms)", "calls", "p50", "p95", "max")]
+        for name, count, p50, p95, slowest in rows:
+            lines.append("{:<22}{:>7}{:>10.2f}{:>10.2f}{:>10.2f}".format(name, count, p50, p95, slowest))
+        return "\n".join(lines)
+
+    def write_csv(self, path):
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["name", "calls", "p50_ms", "p95_ms", "max_ms"])
+            for name, count, p50, p95, slowest in self.rows():
+                writer.writerow([name, count, round(p50, 4), round(p95, 4), round(slowest, 4)])
+
+
+class RenderCache:
+    """
+    Keeps the decoded RGBA board and piece sprites in memory.
+    A file is decoded again only when its mtime or size on disk changes.
+    Scaled copies are cached per scale next to the full size image.
+    Returned images are shared, so paste them onto a copy instead of editing them.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def signature(self, path):
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path, scale=1.0):
+        signature = self.signature(path)
+        entry = self.entries.get((path, scale))
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        if scale == 1.0:
+            with render_stats.timer("decode"):
+                image = Image.open(path).convert("RGBA")
+        else:
+            image = self.get(path)
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            with render_stats.timer("scale"):
+                image = image.resize(size, Image.LANCZOS)
+        self.entries[(path, scale)] = (signature, image)
+        return image
+
+    def report(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return "Render cache: no lookups yet"
+        return "Render cache: {} hits, {} misses ({:.0%} hit rate), {} images resident".format(self.hits, self.misses, self.hits / total, len(self.entries))
+
+
+def fit_size(size, box):
+    # Same rounding as QSize.scaled(box, Qt.KeepAspectRatio)
+    width = box[1] * size[0] // size[1]
+    if width <= box[0]:
+        return (max(1, width), box[1])
+    return (box[0], max(1, box[0] * size[1] // size[0]))
+
+
+class ThumbnailCache:
+    """
+    Pre-scaled PNGs kept on disk between launches, named by a hash of the source
+    file's contents and the target size. index.json remembers each source's mtime,
+    size, hash and dimensions, so an unchanged source is only stat()ed, never read.
+    A source that changed is hashed again and gets a fresh thumbnail. Writing to
+    disk is best effort: if it fails, the scaled image is still returned.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = None
+        self.lock = threading.Lock()
+
+    def load_index(self):
+        if self.index is None:
+            try:
+                with open(os.path.join(self.directory, "index.json")) as index_file:
+                    self.index = json.load(index_file)
+            except (OSError, ValueError):
+                self.index = {}
+
+    def save_index(self):
+        # Best effort, a cache that can't be written is just rebuilt next launch
+        index_path = os.path.join(self.directory, "index.json")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(index_path + ".tmp", "w") as index_file:
+                json.dump(self.index, index_file, indent=1)
+            os.replace(index_path + ".tmp", index_path)
+        except OSError:
+            pass
+
+    def source_entry(self, path):
+        # [mtime, size, content hash, width, height] for the current version of path
+        self.load_index()
+        stat = os.stat(path)
+        entry = self.index.get(path)
+        if (entry is not None) and (entry[:2] == [stat.st_mtime_ns, stat.st_size]):
+            return entry
+        with open(path, "rb") as source:
+            digest = hashlib.sha1(source.read()).hexdigest()
+        with Image.open(path) as header:
+            width, height = header.size
+        entry = [stat.st_mtime_ns, stat.st_size, digest, width, height]
+        self.index[path] = entry
+        self.save_index()
+        return entry
+
+    def source_size(self, path):
+        with self.lock:
+            entry = self.source_entry(path)
+        return (entry[3], entry[4])
+
+    def get(self, path, box):
+        """
+        Returns path as RGBA scaled to fit inside box, building the thumbnail if needed.
+        """
+        with self.lock:
+            entry = self.source_entry(path)
+            thumb_path = os.path.join(self.directory, "{}_{}x{}.png".format(entry[2], box[0], box[1]))
+            if os.path.exists(thumb_path):
+                with render_stats.timer("decode"):
+                    return Image.open(thumb_path).convert("RGBA")
+            with render_stats.timer("decode"):
+                image = Image.open(path).convert("RGBA")
+            size = fit_size(image.size, box)
+            if size != image.size:
+                with render_stats.timer("scale"):
+                    image = image.resize(size, Image.LANCZOS)
+            # Written under a temporary name, so a failed write never leaves a broken thumbnail
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                image.save(thumb_path + ".tmp", "PNG")
+                os.replace(thumb_path + ".tmp", thumb_path)
+            except OSError:
                 pass
+            return image
+
+
+class BoardPyramid:
+    """
+    Pre-scaled copies of the board keyed by scale, so frames can be composited at
+    the size they are displayed at. Each level is built once from the nearest larger
+    level that is already cached, and space_coordinates are mapped into its pixels.
+    Everything is dropped when the board file changes on disk. With a ThumbnailCache
+    the first level comes from disk instead of decoding the full size board.
+    """
+    def __init__(self, cache, path, thumbnails=None):
+        self.cache = cache
+        self.path = path
+        self.thumbnails = thumbnails
+        self.signature = None
+        self.board_size = None
+        self.levels = {}
+        self.coordinates = {}
+
+    def sync(self):
+        signature = self.cache.signature(self.path)
+        if signature != self.signature:
+            self.signature = signature
+            if self.thumbnails is not None:
+                self.board_size = self.thumbnails.source_size(self.path)
             else:
-                m_test = False
-                break
-        if levels in money_brackets[0]:
-            if money > 50:
-                money_test = True
-        elif levels in money_brackets[1]:
-            if money > 100:
-                money_test = True
-        elif levels in money_brackets[2]:
-            if money > 150:
-                money_test = True
-        elif levels in money_brackets[3]:
-            if money > 200:
-                money_test = True
-        elif levels in money_brackets[4]:
-            if money > 250:
-                money_test = True
-        elif levels in money_brackets[5]:
-            if money > 300:
-                money_test = True
-        elif levels in money_brackets[6]:
-            if money > 350:
-                money_test = True
-        if m_test == True:
-            if (money_test == True):
-                if levels == 39 or levels == 136:
-                    count = operator.countOf(inventory,'Boss')
-                    if (count > 1):
-                        options.append(levels)
-                elif (levels == 82) or (levels == 83) or (levels == 84) or (levels == 85) or (levels == 86) or (levels == 87) or (levels == 137) or (levels == 138) or (levels == 139) or (levels == 140) or (levels == 141) or (levels == 142):
-                    if (bonus_coin_count > 1):
-                        options.append(levels)
-                else:
-                    options.append(levels)
-    return options    
+                with Image.open(self.path) as header:
+                    self.board_size = header.size
+            self.levels = {}
+            self.coordinates = {}
+
+    def fit_scale(self, size):
+        # Match Qt's KeepAspectRatio rounding so the level fits the label exactly
+        self.sync()
+        board_w, board_h = self.board_size
+        width = int(size[1] * board_w / board_h)
+        if width <= size[0]:
+            return width / board_w
+        return size[0] / board_w
+
+    def level(self, scale):
+        self.sync()
+        if scale == 1.0:
+            return self.cache.get(self.path)
+        image = self.levels.get(scale)
+        if image is None:
+            larger = [s for s in self.levels if s > scale]
+            size = (max(1, round(self.board_size[0] * scale)), max(1, round(self.board_size[1] * scale)))
+            if larger:
+                with render_stats.timer("scale"):
+                    image = self.levels[min(larger)].resize(size, Image.LANCZOS)
+            elif self.thumbnails is not None:
+                image = self.thumbnails.get(self.path, size)
+                if image.size != size:
+                    with render_stats.timer("scale"):
+                        image = image.resize(size, Image.LANCZOS)
+            else:
+                image = self.cache.get(self.path)
+                with render_stats.timer("scale"):
+                    image = image.resize(size, Image.LANCZOS)
+            self.levels[scale] = image
+        return image
 
-def determine_space(current_space, roll, built_levels, krool_counter, banana_birds_remaining, picture):
+    def coordinates_for(self, scale):
+        coordinates = self.coordinates.get(scale)
+        if coordinates is None:
+            coordinates = [(int(round(x_cor * scale)), int(round(y_cor * scale))) for x_cor, y_cor in space_coordinates]
+            self.coordinates[scale] = coordinates
+        return coordinates
+
+
+class BoardCompositor:
+    """
+    Keeps one working canvas of the board and, before each new frame, only restores
+    the rectangles that the last pieces were pasted over from the pristine board.
+    Once set_display_size() is called it composites on the matching pyramid level.
+    The canvas is reused between frames, so hand it off before drawing the next one.
+    Its pixels live in a preallocated bytearray (canvas.frame_buffer) that
+    change_main_image() hands straight to Qt.
+    """
+    def __init__(self, cache, path, thumbnails=None):
+        self.cache = cache
+        self.path = path
+        self.pyramid = BoardPyramid(cache, path, thumbnails)
+        self.scale = 1.0
+        self.display_size = None
+        self.board = None
+        self.buffer = None
+        self.canvas = None
+        self.dirty = []
+        self.lock = threading.Lock()
+
+    def set_display_size(self, size):
+        self.display_size = size
+        self.scale = self.pyramid.fit_scale(size)
+
+    def sync(self):
+        # Start over with a fresh canvas if the board file was reloaded
+        if self.display_size is not None:
+            self.scale = self.pyramid.fit_scale(self.display_size)
+        board = self.pyramid.level(self.scale)
+        if board is not self.board:
+            self.board = board
+            self.buffer = bytearray(board.width * board.height * 4)
+            self.canvas = Image.frombuffer("RGBA", board.size, self.buffer, "raw", "RGBA", 0, 1)
+            # frombuffer images are copy-on-write, clear the flag so pastes land in the buffer
+            self.canvas.readonly = 0
+            self.canvas.paste(board, (0, 0))
+            self.canvas.frame_buffer = self.buffer
+            self.canvas.frame_lock = self.lock
+            self.dirty = []
+
+    def restore(self):
+        for box in self.dirty:
+            self.canvas.paste(self.board.crop(box), box)
+        self.dirty = []
+
+    def paste(self, space, sprite_path):
+        sprite = self.cache.get(sprite_path, self.scale)
+        x_cor, y_cor = self.pyramid.coordinates_for(self.scale)[space-1]
+        self.canvas.paste(sprite, (x_cor, y_cor), sprite)
+        box = (max(x_cor, 0), max(y_cor, 0), min(x_cor + sprite.width, self.board.width), min(y_cor + sprite.height, self.board.height))
+        if (box[0] < box[2]) and (box[1] < box[3]):
+            self.dirty.append(box)
+
+    def overlay(self, markers):
+        """
+        Composite a list of (space, sprite path) markers onto the board in one pass.
+        Later markers are drawn on top, so the player's piece should come last.
+        """
+        with self.lock:
+            self.sync()
+            with render_stats.timer("composite"):
+                self.restore()
+                for space, sprite_path in markers:
+                    self.paste(space, sprite_path)
+        return self.canvas
+
+    def move_piece(self, space, sprite_path):
+        return self.overlay([(space, sprite_path)])
+
+    def heatmap(self, spread, space, sprite_path):
+        """
+        Covers every space in spread ({space: chance}) with a translucent disc the size of
+        the piece, redder and more solid the likelier it is, then draws the piece on space.
+        Spaces under 2% of the likeliest one are left clear.
+        """
+        with self.lock:
+            self.sync()
+            with render_stats.timer("composite"):
+                self.restore()
+                sprite = self.cache.get(sprite_path, self.scale)
+                coordinates = self.pyramid.coordinates_for(self.scale)
+                layer = Image.new("RGBA", self.canvas.size, (0, 0, 0, 0))
+                draw = ImageDraw.Draw(layer)
+                top = max(spread.values(), default=0)
+                for landing, chance in spread.items():
+                    heat = chance / top
+                    if heat >= 0.02:
+                        x_cor, y_cor = coordinates[landing-1]
+                        draw.ellipse((x_cor, y_cor, x_cor + sprite.width, y_cor + sprite.height), fill=(255, int(220 * (1 - heat)), 0, int(60 + 150 * heat)))
+                self.canvas.alpha_composite(layer)
+                self.dirty.append((0, 0, self.board.width, self.board.height))
+                self.paste(space, sprite_path)
+        return self.canvas
+
+
+def atlas_sources():
+    # Every card fill_inventory() can show, plus the empty slot
+    sources = {}
+    for card in name_list + ["Clear"]:
+        path = "assets/Images/" + card + ".png"
+        if os.path.exists(path):
+            stat = os.stat(path)
+            sources[card] = [path, stat.st_mtime_ns, stat.st_size]
+    return sources
+
+
+def build_card_atlas(slot_size=None):
+    """
+    Packs every card face, pre-scaled to the inventory slot size, into one atlas image
+    (assets/Atlas/cards.png) and writes a manifest of where each card sits (cards.json).
+    Run with --build-atlas, or let load_card_atlas() rebuild it when a card changes.
+    """
+    if slot_size is None:
+        slot_size = card_slot_size
+    sources = atlas_sources()
+    columns = 10
+    rows = (len(sources) + columns - 1) // columns
+    atlas = Image.new("RGBA", (columns * slot_size[0], max(rows, 1) * slot_size[1]), (0, 0, 0, 0))
+    cards = {}
+    for index, card in enumerate(sorted(sources)):
+        # Scaled with the same fit as Qt.KeepAspectRatio, so the cut pixmap matches a scaled QImage
+        image = thumbnail_cache.get(sources[card][0], slot_size)
+        size = image.size
+        x_cor = (index % columns) * slot_size[0]
+        y_cor = (index // columns) * slot_size[1]
+        atlas.paste(image, (x_cor, y_cor))
+        cards[card] = [x_cor, y_cor, size[0], size[1]]
+    os.makedirs(atlas_dir, exist_ok=True)
+    atlas.save(os.path.join(atlas_dir, "cards.png"))
+    manifest = {"slot_size": list(slot_size), "sources": sources, "cards": cards}
+    with open(os.path.join(atlas_dir, "cards.json"), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=1)
+    return manifest
+
+
+def load_card_atlas():
+    """
+    Returns the atlas as a QPixmap and a dict of card name -> [x, y, w, h].
+    The atlas is rebuilt first if it is missing, was built for another slot size,
+    or any source card changed since it was packed. If it can't be written, no card
+    is in the atlas and card_pixmap() loads each card from its own file.
+    """
+    manifest = None
+    try:
+        with open(os.path.join(atlas_dir, "cards.json")) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        pass
+    if (manifest is None) or (tuple(manifest["slot_size"]) != card_slot_size) or (manifest["sources"] != atlas_sources()) or (not os.path.exists(os.path.join(atlas_dir, "cards.png"))):
+        try:
+            manifest = build_card_atlas()
+        except OSError as e:
+            print(f"Warning: Could not build the card atlas ({e}), loading cards one by one")
+            return QPixmap(), {}
+    atlas = QPixmap(os.path.join(atlas_dir, "cards.png"))
+    if atlas.isNull():
+        return atlas, {}
+    return atlas, manifest["cards"]
+
+
+render_stats = RenderStats()
+render_cache = RenderCache()
+thumbnail_cache = ThumbnailCache("assets/Cache/thumbnails")
+board_path = "assets/Board/dim_board.png"
+marker_path = "assets/Statics/Orange Star.png"
+board_compositor = BoardCompositor(render_cache, board_path, thumbnail_cache)
+card_slot_size = (67, 97)
+atlas_dir = "assets/Atlas"
+
+
+def determine_space(current_space, roll, built_levels, krool_counter, banana_birds_remaining, picture, tracker=None, die=None):
+    """
+    Moves the piece roll steps along board_next from current_space, asking which way to
+    go at every fork and whether to go through every open gate. With the hand's
+    BuildTracker and the die, fork_advisor's scores are shown with each fork preview.
+    Returns the new space and whether the piece passed the start space.
+    """
     rem = roll
-    roll_count = 1
     cur_space = current_space
     pass_start = False
     while rem != 0:
-        if (cur_space == 6):
-            if (rem != 1):
-                pass_start = True
-            if (len(built_levels) == 142) and (len(krool_counter) == 3) and (banana_birds_remaining == 0):
-                rem_check = False
-                d_check = False
-                while (d_check == False):
-                    win_question = input("Do you want to go to the start space (Yes or No)\n").lower()
-                    print("")
-                    if (win_question == "yes"):
-                        cur_space = 5
-                        d_check = True
-                        rem_check = True
-                        break
-                    else:
-                        ans2 = input("Are you sure (Yes or no)").lower()
-                        if ans2 == "yes":
-                            d_check = True
-                        else:
-                            d_check = False
-                if (rem_check == True):
-                    break
-            else:
-                cur_space = 7
-        elif (cur_space == 12):
-            ans = False
-            if (rem > 11):
-                new_rem = rem - 11
-                split_1 = new_rem - 1 + 41
-            else:
-                split_1 = rem-1+13
-            if (rem > 17):
-                new_rem = rem - 17
-                split_2 = new_rem - 1 + 140
-            else:
-                split_2 = rem-1+24
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA")
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[current_space + (roll-rem) - 1][0]
-            y_cor_orig = space_coordinates[current_space + (roll-rem) - 1][1]
-            piece_position = (x_cor_1, y_cor_1)
-            combined_image = board_image.copy()
-            combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            while (ans == False):
-                split = input("Would you like to continue through Kongo Jungle or move to Monkey Mines, 1 for KJ, 2 for MM").lower()
-                if (split == "1"):
-                    cur_space = 13
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 24
-                    ans = True
-                    
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 9):
-            ans = False
-            m_test = False
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA") 
-            if (rem > 3):
-                m_test = True
-                if (rem > 14):
-                    new_rem = rem - 14
-                    split_1 = new_rem - 1 + 41
-                else:
-                    new_rem = rem - 3
-                    split_1 = new_rem - 1 + 13
-                
-                new_rem = rem - 3
-                split_4 = new_rem - 1 + 24
-                x_cor_4 = space_coordinates[split_4 - 1][0]
-                y_cor_4 = space_coordinates[split_4 - 1][1]
-                piece_position = (x_cor_4, y_cor_4)
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                #KJ 10-12
-                split_1 = rem-1+10
-            if (rem > 17):
-                new_rem = rem - 17
-                split_2 = new_rem - 1 + 288
-            else:
-                split_2 = rem - 1 + 254
-            
-            if (rem > 4):
-                if (rem > 7):
-                    new_rem = rem-7
-                    split_5 = new_rem - 1 + 274
-                    x_cor_5 = space_coordinates[split_5 - 1][0]
-                    y_cor_5 = space_coordinates[split_5 - 1][1]
-                    piece_position = (x_cor_5, y_cor_5)
-                    if (m_test == True):
-                        combined_image = combined_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                else:
-                    new_rem = rem-4
-                    split_5 = new_rem - 1 + 271
-                    x_cor_5 = space_coordinates[split_5 - 1][0]
-                    y_cor_5 = space_coordinates[split_5 - 1][1]
-                    piece_position = (x_cor_5, y_cor_5)
-                    if (m_test == True):
-                        combined_image = combined_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                if (rem > 17):
-                    new_rem = rem-17
-                    split_3 = new_rem - 1 + 52
-                else:
-                    new_rem = rem - 4
-                    split_3 = new_rem - 1 + 125
-                if (rem > 7):
-                    m_test = True
-                    new_rem = rem-7
-                    split_6 = new_rem - 1 + 138
-                    x_cor_6 = space_coordinates[split_6 - 1][0]
-                    y_cor_6 = space_coordinates[split_6 - 1][1]
-                    piece_position = (x_cor_6, y_cor_6)
-                    if (m_test == True):
-                        combined_image = combined_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                split_3 = rem - 1 + 121
-                
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_3 = space_coordinates[split_3 - 1][0]
-            y_cor_3 = space_coordinates[split_3 - 1][1]
-            x_cor_orig = space_coordinates[8][0]
-            y_cor_orig = space_coordinates[8][1]
-            piece_position = (x_cor_1, y_cor_1)
-            if (m_test == True):
-                combined_image = combined_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_3, y_cor_3)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image4 = combined_image3.copy()
-            combined_image4.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image4)
-            ans = False
-            while (ans == False):
-                split = input("Would you like to continue through Kongo Jungle or move to Lake Orangatanga, or move to Gangplank Galleon, 1 for KJ, 2 for LO, 3 for GpG\n").lower()
-                if (split == "1"):
-                    cur_space = 10
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 254
-                    ans = True
-                elif (split == "3"):
-                    cur_space = 121
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 124):
-            m_test = False
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA")
-            if (rem > 13):
-                new_rem = rem - 13
-                split_1 = new_rem - 1 + 52
-            else:
-                split_1 = rem-1+125
-            if (rem > 3):
-                if (3 < rem < 18):
-                    m_test = True
-                    split_2 = rem-1+271
-                    new_rem = rem-3
-                    split_3 = new_rem + 138 - 1
-                    x_cor_3 = space_coordinates[split_3 - 1][0]
-                    y_cor_3 = space_coordinates[split_3 - 1][1]
-                    piece_position = (x_cor_3, y_cor_3)
-                    combined_image = board_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-                elif (rem == 18):
-                    m_test = True
-                    split_3 = 152
-                    split_2 = 338
-                    x_cor_3 = space_coordinates[split_3 - 1][0]
-                    y_cor_3 = space_coordinates[split_3 - 1][1]
-                    piece_position = (x_cor_3, y_cor_3)
-                    combined_image = board_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-                elif (rem > 18):
-                    m_test = True
-                    new_rem = rem-3
-                    split_3 = new_rem + 138 - 1
-                    new_rem = rem-18
-                    split_2 = new_rem + 288 - 1
-                    x_cor_3 = space_coordinates[split_3 - 1][0]
-                    y_cor_3 = space_coordinates[split_3 - 1][1]
-                    piece_position = (x_cor_3, y_cor_3)
-                    combined_image = board_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                split_2 = rem-1+271
-            
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            
-            x_cor_orig = space_coordinates[123][0]
-            y_cor_orig = space_coordinates[123][1]
-            piece_position = (x_cor_1, y_cor_1)
-            if (m_test == True):
-                combined_image = combined_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like to continue through Gangplank Galleon or move to Kremwood Forest, 1 for GpG, 2 for KF\n").lower()
-                if (split == "1"):
-                    cur_space = 125
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 271
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 273):
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA")
-            if (rem == 15):
-                split_1 = 338
-            elif (rem > 15):
-                new_rem = rem - 15
-                split_1 = new_rem - 1 + 288
-            else:
-                split_1 = rem-1+274
-            if (rem > 17):
-                new_rem = rem - 17
-                split_2 = new_rem - 1 + 165
-            else:
-                split_2 = rem-1+138
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[272][0]
-            y_cor_orig = space_coordinates[272][1]
-            piece_position = (x_cor_1, y_cor_1)
-            combined_image = board_image.copy()
-            combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like to continue through Kremwood Forest or move to Crocodile Core, 1 for KF, 2 for CrC\n").lower()
-                if (split == "1"):
-                    cur_space = 274
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 138
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 60):
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA")                  
-            split_1 = rem-1+61
-            if (rem > 17):
-                new_rem = rem - 17
-                split_2 = new_rem - 1 + 288
-            else:
-                split_2 = rem-1+322 
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[59][0]
-            y_cor_orig = space_coordinates[59][1]
-            piece_position = (x_cor_1, y_cor_1)
-            combined_image = board_image.copy()
-            combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like move to Gorilla Glacier or K3, 1 for GG, 2 for K3\n").lower()
-                if (split == "1"):
-                    cur_space = 61
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 322
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 174):
-            m_test = False
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA") 
-            if (rem > 9):
-                m_test = True
-                if (rem > 17):
-                    new_rem = rem - 17
-                    split_1 = new_rem - 1 + 81
-                else:
-                    new_rem = rem - 9
-                    split_1 = new_rem - 1 + 348
-                new_rem = rem - 9
-                split_4 = new_rem - 1 + 356
-                x_cor_4 = space_coordinates[split_4 - 1][0]
-                y_cor_4 = space_coordinates[split_4 - 1][1]
-                piece_position = (x_cor_4, y_cor_4)
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                split_1 = rem-1+339
-            split_2 = rem - 1 + 212
-            if (rem > 17):
-                new_rem = rem - 17
-                split_3 = new_rem - 1 + 237
-            else:
-                split_3 = rem - 1 + 195
-                
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_3 = space_coordinates[split_3 - 1][0]
-            y_cor_3 = space_coordinates[split_3 - 1][1]
-            x_cor_orig = space_coordinates[173][0]
-            y_cor_orig = space_coordinates[173][1]
-            piece_position = (x_cor_1, y_cor_1)
-            if (m_test == True):
-                combined_image = combined_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_3, y_cor_3)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image4 = combined_image3.copy()
-            combined_image4.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image4)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like to move to Razor Ridge, K. Rool's Keep, or Gloomy Gulch, 1 for RR, 2 for KRK, 3 for GlG\n").lower()
-                if (split == "1"):
-                    cur_space = 339
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 212
-                    ans = True
-                elif (split == "3"):
-                    cur_space = 195
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 371):
-            if (88 in built_levels) and (89 in built_levels) and (90 in built_levels) and (91 in built_levels) and (92 in built_levels) and (93 in built_levels) and (94 in built_levels) and (95 in built_levels) and (96 in built_levels) and (97 in built_levels) and (98 in built_levels) and (99 in built_levels) and (100 in built_levels) and (101 in built_levels) and (102 in built_levels) and (103 in built_levels) and (104 in built_levels) and (105 in built_levels) and (106 in built_levels) and (107 in built_levels) and (108 in built_levels) and (109 in built_levels) and (110 in built_levels) and (111 in built_levels) and (112 in built_levels) and (113 in built_levels) and (114 in built_levels) and (115 in built_levels) and (116 in built_levels) and (117 in built_levels) and (118 in built_levels) and (119 in built_levels) and (120 in built_levels) and (121 in built_levels) and (122 in built_levels) and (123 in built_levels) and (124 in built_levels) and (125 in built_levels) and (126 in built_levels) and (127 in built_levels) and (128 in built_levels) and (129 in built_levels) and (130 in built_levels) and (131 in built_levels) and (132 in built_levels) and (133 in built_levels) and (134 in built_levels) and (135 in built_levels) and (136 in built_levels) and (137 in built_levels) and (138 in built_levels) and (139 in built_levels) and (140 in built_levels) and (141 in built_levels) and (142 in built_levels):
-                if (3 not in krool_counter):
-                    m_test = False
-                    board_image = Image.open("assets/Board/dim_board.png")
-                    piece_image = Image.open("assets/Statics/Orange Star.png")
-                    piece_image = piece_image.convert("RGBA") 
-                    if (rem > 4):
-                        m_test = True
-                        new_rem = rem - 4
-                        split_1 = new_rem - 1 + 393
-                        split_3 = new_rem - 1 + 376
-                        x_cor_3 = space_coordinates[split_3 - 1][0]
-                        y_cor_3 = space_coordinates[split_3 - 1][1]
-                        piece_position = (x_cor_3, y_cor_3)
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        split_1 = rem-1+372
-                    if (rem > 9):
-                        new_rem = rem - 9
-                        split_2 = new_rem - 1 + 305
-                    else:
-                        if (rem == 1):
-                            split_2 = 100
-                        elif (rem == 2):
-                            split_2 = 99
-                        elif (rem == 3):
-                            split_2 = 98
-                        elif (rem == 4):
-                            split_2 = 97
-                        elif (rem == 5):
-                            split_2 = 96
-                        elif (rem == 6):
-                            split_2 = 95
-                        elif (rem == 7):
-                            split_2 = 94
-                        elif (rem == 8):
-                            split_2 = 93
-                        elif (rem == 9):
-                            split_2 = 92
-                        
-                    x_cor_1 = space_coordinates[split_1 - 1][0]
-                    y_cor_1 = space_coordinates[split_1 - 1][1]
-                    x_cor_2 = space_coordinates[split_2 - 1][0]
-                    y_cor_2 = space_coordinates[split_2 - 1][1]
-                    x_cor_orig = space_coordinates[370][0]
-                    y_cor_orig = space_coordinates[370][1]
-                    piece_position = (x_cor_1, y_cor_1)
-                    if (m_test == True):
-                        combined_image = combined_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    piece_position = (x_cor_2, y_cor_2)
-                    combined_image2 = combined_image.copy()
-                    combined_image2.paste(piece_image, piece_position, piece_image)
-                    piece_image2 = Image.open(picture)
-                    piece_image2 = piece_image2.convert("RGBA")
-                    piece_position = (x_cor_orig, y_cor_orig)
-                    combined_image3 = combined_image2.copy()
-                    combined_image3.paste(piece_image2, piece_position, piece_image2)
-                    window.change_main_image(combined_image3)
-                    ans = False
-                    ans = False
-                    k3_door = False
-                    while (ans == False):
-                        split = input("Would you like to fight Baron K. Roolenstein, 1 for Yes, 2 for No\n").lower()
-                        if (split == "1"):
-                            cur_space = 3
-                            ans = True
-                            k3_door = True
-                            break
-                            
-                        elif (split == "2"):
-                            cur_space = 372
-                            ans = True
-                        else:
-                            ans = False
-                    if (k3_door == True):
-                        break
-                else:
-                    m_test = False
-                    board_image = Image.open("assets/Board/dim_board.png")
-                    piece_image = Image.open("assets/Statics/Orange Star.png")
-                    piece_image = piece_image.convert("RGBA") 
-                    if (rem > 4):
-                        m_test = True
-                        new_rem = rem - 4
-                        split_1 = new_rem - 1 + 393
-                        split_3 = new_rem - 1 + 376
-                        x_cor_3 = space_coordinates[split_3 - 1][0]
-                        y_cor_3 = space_coordinates[split_3 - 1][1]
-                        piece_position = (x_cor_3, y_cor_3)
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        split_1 = rem-1+372
-                    if (rem > 9):
-                        new_rem = rem - 9
-                        split_2 = new_rem - 1 + 305
-                    else:
-                        if (rem == 1):
-                            split_2 = 100
-                        elif (rem == 2):
-                            split_2 = 99
-                        elif (rem == 3):
-                            split_2 = 98
-                        elif (rem == 4):
-                            split_2 = 97
-                        elif (rem == 5):
-                            split_2 = 96
-                        elif (rem == 6):
-                            split_2 = 95
-                        elif (rem == 7):
-                            split_2 = 94
-                        elif (rem == 8):
-                            split_2 = 93
-                        elif (rem == 9):
-                            split_2 = 92
-                        
-                    x_cor_1 = space_coordinates[split_1 - 1][0]
-                    y_cor_1 = space_coordinates[split_1 - 1][1]
-                    x_cor_2 = space_coordinates[split_2 - 1][0]
-                    y_cor_2 = space_coordinates[split_2 - 1][1]
-                    x_cor_orig = space_coordinates[370][0]
-                    y_cor_orig = space_coordinates[370][1]
-                    piece_position = (x_cor_1, y_cor_1)
-                    if (m_test == True):
-                        combined_image = combined_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    else:
-                        combined_image = board_image.copy()
-                        combined_image.paste(piece_image, piece_position, piece_image)
-                    piece_position = (x_cor_2, y_cor_2)
-                    combined_image2 = combined_image.copy()
-                    combined_image2.paste(piece_image, piece_position, piece_image)
-                    piece_image2 = Image.open(picture)
-                    piece_image2 = piece_image2.convert("RGBA")
-                    piece_position = (x_cor_orig, y_cor_orig)
-                    combined_image3 = combined_image2.copy()
-                    combined_image3.paste(piece_image2, piece_position, piece_image2)
-                    window.change_main_image(combined_image3)
-                    ans = False
-                    while (ans == False):
-                        split = input("Would you like to continue through Pacifica or move to Kremkroc Industries Inc., 1 for P, 2 for KII\n").lower()
-                        if (split == "1"):
-                            cur_space = 372
-                            ans = True
-                        elif (split == "2"):
-                            cur_space = 100
-                            ans = True
-                        else:
-                            ans = False
-            else:
-                m_test = False
-                board_image = Image.open("assets/Board/dim_board.png")
-                piece_image = Image.open("assets/Statics/Orange Star.png")
-                piece_image = piece_image.convert("RGBA") 
-                if (rem > 4):
-                    m_test = True
-                    new_rem = rem - 4
-                    split_1 = new_rem - 1 + 393
-                    split_3 = new_rem - 1 + 376
-                    x_cor_3 = space_coordinates[split_3 - 1][0]
-                    y_cor_3 = space_coordinates[split_3 - 1][1]
-                    piece_position = (x_cor_3, y_cor_3)
-                    combined_image = board_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-                else:
-                    split_1 = rem-1+372
-                if (rem > 9):
-                    new_rem = rem - 9
-                    split_2 = new_rem - 1 + 305
-                else:
-                    if (rem == 1):
-                        split_2 = 100
-                    elif (rem == 2):
-                        split_2 = 99
-                    elif (rem == 3):
-                        split_2 = 98
-                    elif (rem == 4):
-                        split_2 = 97
-                    elif (rem == 5):
-                        split_2 = 96
-                    elif (rem == 6):
-                        split_2 = 95
-                    elif (rem == 7):
-                        split_2 = 94
-                    elif (rem == 8):
-                        split_2 = 93
-                    elif (rem == 9):
-                        split_2 = 92
-                    
-                x_cor_1 = space_coordinates[split_1 - 1][0]
-                y_cor_1 = space_coordinates[split_1 - 1][1]
-                x_cor_2 = space_coordinates[split_2 - 1][0]
-                y_cor_2 = space_coordinates[split_2 - 1][1]
-                x_cor_orig = space_coordinates[370][0]
-                y_cor_orig = space_coordinates[370][1]
-                piece_position = (x_cor_1, y_cor_1)
-                if (m_test == True):
-                    combined_image = combined_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-                else:
-                    combined_image = board_image.copy()
-                    combined_image.paste(piece_image, piece_position, piece_image)
-                piece_position = (x_cor_2, y_cor_2)
-                combined_image2 = combined_image.copy()
-                combined_image2.paste(piece_image, piece_position, piece_image)
-                piece_image2 = Image.open(picture)
-                piece_image2 = piece_image2.convert("RGBA")
-                piece_position = (x_cor_orig, y_cor_orig)
-                combined_image3 = combined_image2.copy()
-                combined_image3.paste(piece_image2, piece_position, piece_image2)
-                window.change_main_image(combined_image3)
-                ans = False
-                ans = False
-                while (ans == False):
-                    split = input("Would you like to continue through Pacifica or move to Kremkroc Industries Inc., 1 for P, 2 for KII\n").lower()
-                    if (split == "1"):
-                        cur_space = 372
-                        ans = True
-                    elif (split == "2"):
-                        cur_space = 100
-                        ans = True
-                    else:
-                        ans = False
-                print("")
-        elif (cur_space == 375):
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA") 
-            if (rem > 17):
-                new_rem = rem - 17
-                split_1 = new_rem - 1 + 232
-            else:
-                split_1 = rem-1+393
-            if (rem > 17):
-                new_rem = rem - 17
-                split_2 = new_rem - 1 + 232
-            else:
-                split_2 = rem-1+376
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[374][0]
-            y_cor_orig = space_coordinates[374][1]
-            piece_position = (x_cor_1, y_cor_1)
-            combined_image = board_image.copy()
-            combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like to move through Krematoa or KAOS Kore, 1 for K, 2 for KsK\n").lower()
-                if (split == "1"):
-                    cur_space = 393
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 376
-                    ans = True
-                else:
-                    ans = False
-            print("")
-        elif (cur_space == 347):
-            m_test = False
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open("assets/Statics/Orange Star.png")
-            piece_image = piece_image.convert("RGBA") 
-            if (rem > 16):
-                m_test = True
-                new_rem = rem - 16
-                split_1 = new_rem  - 1 + 372
-                if (rem == 17):
-                    split_3 = 100
-                elif (rem == 18):
-                    split_3 = 99
-                elif (rem == 19):
-                    split_3 = 98
-                elif (rem == 20):
-                    split_3 = 97
-                x_cor_3 = space_coordinates[split_3 - 1][0]
-                y_cor_3 = space_coordinates[split_3 - 1][1]
-                piece_position = (x_cor_3, y_cor_3)
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                split_1 = rem-1+356
-            if (rem > 8):
-                new_rem = rem - 8
-                split_2 = new_rem - 1 + 81
-            else:
-                split_2 = rem-1+348
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[346][0]
-            y_cor_orig = space_coordinates[346][1]
-            piece_position = (x_cor_1, y_cor_1)
-            if (m_test == True):
-                combined_image = combined_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            else:
-                combined_image = board_image.copy()
-                combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            ans = False
-            while (ans == False):
-                split = input("Would you like to continue through Razor Ridge or move to Pacifica, 1 for RR, 2 for P\n").lower()
-                if (split == "1"):
-                    cur_space = 348
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 356
-                    ans = True
-                else:
-                    ans = False
+        if (cur_space == 6) and (rem != 1):
+            pass_start = True
+        step = board_next[cur_space]
+        if (step == 0):
+            show_fork_preview(fork_markers(cur_space, rem, picture))
+        if (cur_space in board_gates) and gate_open(cur_space, built_levels, krool_counter, banana_birds_remaining):
+            if (ask_gate(board_gates[cur_space]) == True):
+                cur_space = board_gates[cur_space].door
+                break
+            if (step == 0):
+                step = board_forks[cur_space][0]
+        elif (step == 0):
+            if (tracker is not None) and (die is not None):
+                print(fork_advisor.describe(fork_advisor.advise(cur_space, rem, die, tracker, built_levels)))
+            step = ask_fork(cur_space)
             print("")
-        elif (cur_space == 304):
-            board_image = Image.open("assets/Board/dim_board.png")
-            piece_image = Image.open(("assets/Statics/Orange Star.png"))
-            piece_image = piece_image.convert("RGBA") 
-            split_1 = rem-1+101
-            split_2 = rem-1+175
-            x_cor_1 = space_coordinates[split_1 - 1][0]
-            y_cor_1 = space_coordinates[split_1 - 1][1]
-            x_cor_2 = space_coordinates[split_2 - 1][0]
-            y_cor_2 = space_coordinates[split_2 - 1][1]
-            x_cor_orig = space_coordinates[303][0]
-            y_cor_orig = space_coordinates[303][1]
-            piece_position = (x_cor_1, y_cor_1)
-            combined_image = board_image.copy()
-            combined_image.paste(piece_image, piece_position, piece_image)
-            piece_position = (x_cor_2, y_cor_2)
-            combined_image2 = combined_image.copy()
-            combined_image2.paste(piece_image, piece_position, piece_image)
-            piece_image2 = Image.open(picture)
-            piece_image2 = piece_image2.convert("RGBA")
-            piece_position = (x_cor_orig, y_cor_orig)
-            combined_image3 = combined_image2.copy()
-            combined_image3.paste(piece_image2, piece_position, piece_image2)
-            window.change_main_image(combined_image3)
-            ans = False
-            while (ans == False):
-                split = input("Would you move to Chimp Caverns or Krazy Kremland, 1 for CC, 2 for KK\n").lower()
-                if (split == "1"):
-                    cur_space = 101
-                    ans = True
-                elif (split == "2"):
-                    cur_space = 175
-                    ans = True
-                else:
-                    ans = False
+        if (1 <= cur_space <= 3):
+            # main() doesn't print the roll while the piece is on a K. Rool space
+            print("\nYou rolled a", roll)
             print("")
-        elif (cur_space == 53):
-            if (1 in built_levels) and (2 in built_levels) and (3 in built_levels) and (4 in built_levels) and (5 in built_levels) and (6 in built_levels) and (7 in built_levels) and (8 in built_levels) and (9 in built_levels) and (10 in built_levels) and (11 in built_levels) and (12 in built_levels) and (13 in built_levels) and (14 in built_levels) and (15 in built_levels) and (16 in built_levels) and (17 in built_levels) and (18 in built_levels) and (19 in built_levels) and (20 in built_levels) and (21 in built_levels) and (22 in built_levels) and (23 in built_levels) and (24 in built_levels) and (25 in built_levels) and (26 in built_levels) and (27 in built_levels) and (28 in built_levels) and (29 in built_levels) and (30 in built_levels) and (31 in built_levels) and (32 in built_levels) and (33 in built_levels) and (34 in built_levels) and (35 in built_levels) and (36 in built_levels) and (37 in built_levels) and (38 in built_levels) and (39 in built_levels) and (40 in built_levels):
-                if (1 not in krool_counter):
-                    ans = False
-                    k1_door = False
-                    while (ans == False):
-                        split = input("Would to fight King K. Rool, 1 for Yes, 2 for No\n").lower()
-                        if (split == "1"):
-                            cur_space = 1
-                            ans = True
-                            k1_door = True
-                            break
-                            
-                        elif (split == "2"):
-                            cur_space = 54
-                            ans = True
-                        else:
-                            ans = False
-                    if (k1_door == True):
-                        break
-                else:
-                    cur_space = 54
-            else:
-                cur_space = 54
-        elif (cur_space == 1):
-            if (1 not in krool_counter):
-                ans = False
-                k1_door = False
-                while (ans == False):
-                    split = input("\nWould you like to fight King K. Rool again, 1 for Yes, 2 for No\n").lower()
-                    if (split == "1"):
-                        cur_space = 1
-                        ans = True
-                        k1_door = True
-                        break
-                        
-                    elif (split == "2"):
-                        cur_space = 53
-                        print("\nYou rolled a", roll)
-                        print("")
-                        ans = True
-                    else:
-                        ans = False
-                if (k1_door == True):
-                    break
-            else:
-                print("\nYou rolled a", roll)
-                print("")
-                cur_space = 53
-        elif (cur_space == 172):
-            if (41 in built_levels) and (42 in built_levels) and (43 in built_levels) and (44 in built_levels) and (45 in built_levels) and (46 in built_levels) and (47 in built_levels) and (48 in built_levels) and (49 in built_levels) and (50 in built_levels) and (51 in built_levels) and (52 in built_levels) and (53 in built_levels) and (54 in built_levels) and (55 in built_levels) and (56 in built_levels) and (57 in built_levels) and (58 in built_levels) and (59 in built_levels) and (60 in built_levels) and (61 in built_levels) and (62 in built_levels) and (63 in built_levels) and (64 in built_levels) and (65 in built_levels) and (66 in built_levels) and (67 in built_levels) and (68 in built_levels) and (69 in built_levels) and (70 in built_levels) and (71 in built_levels) and (72 in built_levels) and (73 in built_levels) and (74 in built_levels) and (75 in built_levels) and (76 in built_levels) and (77 in built_levels) and (78 in built_levels) and (79 in built_levels) and (80 in built_levels) and (81 in built_levels) and (82 in built_levels) and (83 in built_levels) and (84 in built_levels) and (85 in built_levels) and (86 in built_levels) and (87 in built_levels):
-                if (2 not in krool_counter):
-                    ans = False
-                    k2_door = False
-                    while (ans == False):
-                        split = input("Would to fight Kaptain K. Rool, 1 for Yes, 2 for No\n").lower()
-                        if (split == "1"):
-                            cur_space = 2
-                            ans = True
-                            k2_door = True
-                            break
-                            
-                        elif (split == "2"):
-                            cur_space = 173
-                            ans = True
-                        else:
-                            ans = False
-                    if (k2_door == True):
-                        break
-                else:
-                    cur_space = 173
-            else:
-                cur_space = 173
-        elif (cur_space == 2):
-            if (2 not in krool_counter):
-                ans = False
-                k2_door = False
-                while (ans == False):
-                    split = input("\nWould you like to fight Kaptain K. Rool again, 1 for Yes, 2 for No\n").lower()
-                    if (split == "1"):
-                        cur_space = 2
-                        ans = True
-                        k2_door = True
-                        break
-                        
-                    elif (split == "2"):
-                        cur_space = 172
-                        print("\nYou rolled a", roll)
-                        print("")
-                        ans = True
-                    else:
-                        ans = False
-                if (k2_door == True):
-                    break
-            else:
-                print("\nYou rolled a", roll)
-                print("")
-                cur_space = 172
-        elif (cur_space == 3):
-            if (3 not in krool_counter):
-                ans = False
-                k3_door = False
-                while (ans == False):
-                    split = input("\nWould you like to fight Baron K. Roolenstein again, 1 for Yes, 2 for No\n").lower()
-                    if (split == "1"):
-                        cur_space = 3
-                        ans = True
-                        k3_door = True
-                        break
-                        
-                    elif (split == "2"):
-                        cur_space = 371
-                        print("\nYou rolled a", roll)
-                        print("")
-                        ans = True
-                    else:
-                        ans = False
-                if (k3_door == True):
-                    break
-            else:
-                print("\nYou rolled a", roll)
-                print("")
-                cur_space = 371
-        elif (cur_space == 295):
-            queen = input("\nWould you like to visit Queen Banana Bird (Yes or No)\n").lower()
-            if (queen == "yes"):
-                cur_space = 4
-                break
-            else:
-                cur_space = 296
-        elif (cur_space == 4):
-            cur_space = 295
-        elif (cur_space == 40):
-            cur_space = 140
-        elif (cur_space == 231):
-            cur_space = 347
-        elif (cur_space == 154):
-            cur_space = 165
-        elif (cur_space == 137):
-            cur_space = 52
-        elif (cur_space == 23):
-            cur_space = 41
-        elif (cur_space == 80):
-            cur_space = 155
-        elif (cur_space == 270):
-            cur_space = 288
-        elif (cur_space == 287):
-            cur_space = 338
-        elif (cur_space == 355):
-            cur_space = 81
-        elif (cur_space == 338):
-            cur_space = 288
-        elif (cur_space == 120):
-            cur_space = 81
-        elif (cur_space == 92):
-            cur_space = 305
-        elif (cur_space == 253):
-            cur_space = 363
-        elif (cur_space == 194):
-            cur_space = 237
-        elif (cur_space == 211):
-            cur_space = 237
-        elif (cur_space == 236):
-            cur_space = 6
-        elif (cur_space == 409):
-            cur_space = 232
-        elif (cur_space == 392):
-            cur_space = 232
-        elif (cur_space == 321):
-            cur_space = 232
-        
-            
-        elif ((cur_space == 93) or (cur_space == 94)or (cur_space == 95)or (cur_space == 96)
-            or (cur_space == 97)or (cur_space == 98)or (cur_space == 99)or (cur_space == 100)):
-            cur_space -= 1
-        else:
-            cur_space += 1
+        cur_space = step
         rem -= 1
-        roll_count += 1
-    
-    new_space = cur_space
-  
-    return new_space, pass_start
+    return cur_space, pass_start
+
+
+def gate_open(space, built_levels, krool_counter, banana_birds_remaining):
+    gate = board_gates[space]
+    if (gate.kind == "finish"):
+        return (len(built_levels) == 142) and (len(krool_counter) == 3) and (banana_birds_remaining == 0)
+    if (gate.kind == "queen"):
+        return True
+    if (gate.door in krool_counter):
+        return False
+    # Still on the K. Rool space after losing to him, or at his door with his game all built
+    return (space == gate.door) or all(level in built_levels for level in krool_door_levels[gate.door])
+
+
+def ask_gate(gate):
+    """
+    Asks whether to go through gate's door, True for yes.
+    """
+    if (gate.kind == "queen"):
+        return input(gate.prompt).lower() == "yes"
+    while True:
+        answer = input(gate.prompt).lower()
+        if (gate.kind == "finish"):
+            print("")
+            if (answer == "yes"):
+                return True
+            if (input("Are you sure (Yes or no)").lower() == "yes"):
+                return False
+        elif (answer == "1"):
+            return True
+        elif (answer == "2"):
+            return False
+
+
+def ask_fork(space):
+    options = board_forks[space]
+    answers = [str(number) for number in range(1, len(options) + 1)]
+    while True:
+        split = input(fork_prompts[space]).lower()
+        if split in answers:
+            return options[answers.index(split)]
+
+
+def fork_markers(space, rem, picture):
+    # Stars on every space the rest of the move could end on, whichever way is picked
+    landings = board_landings(space, rem)
+    return [(landing, marker_path) for landing in sorted(landings)] + [(space, picture)]
 
 
 def dice_roll(die):
@@ -1213,39 +785,71 @@ def dice_roll(die):
 
 
 def level_check(inventory, level_list, bonus_coin_count, money):
-    options = []
-    possible_levels = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 
-                       71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142]
-    for levels in level_list:
-        opt = 0
-        for opts in possible_levels:
-            if opts == levels:
-                possible_levels.pop(opt)
-            opt += 1
-    
-    for levels in possible_levels:
-        materials = material_list[levels-1]
-        m_test = True
-        money_test = False
-        for req in materials:
-            if req in inventory:
-                pass
-            else:
-                m_test = False
-                break
-        money_test = True
-        if m_test == True:
-            if (money_test == True):
-                if levels == 39 or levels == 136:
-                    count = operator.countOf(inventory,'Boss')
-                    if (count > 1):
-                        options.append(levels)
-                elif (levels == 82) or (levels == 83) or (levels == 84) or (levels == 85) or (levels == 86) or (levels == 87) or (levels == 137) or (levels == 138) or (levels == 139) or (levels == 140) or (levels == 141) or (levels == 142):
-                    if (bonus_coin_count > 1):
-                        options.append(levels)
-                else:
-                    options.append(levels)
-    return options
+    """
+    Returns the levels not in level_list (the built levels) that inventory covers.
+    Works on the compiled requirement masks, every level is checked at once: a level is
+    out if it needs a material copy the inventory does not hold. Lost World and Krematoa
+    levels also need 2 Bonus Coins. Money is not checked here, the price is paid when
+    the level is built.
+    """
+    blocked = levels_mask(level_list)
+    missing = all_slots_mask & ~inventory_mask(inventory)
+    while missing:
+        slot_bit = missing & -missing
+        blocked |= slot_level_masks[slot_bit.bit_length() - 1]
+        missing ^= slot_bit
+    if (bonus_coin_count <= 1):
+        blocked |= bonus_coin_levels_mask
+    return mask_levels(all_levels_mask & ~blocked)
+
+
+def level_check_batch(count_rows, built_level_lists, money_list, bonus_coin_counts):
+    """
+    level_check() for many inventories at once, for simulations.
+    count_rows[n] is inventory n as a count vector over material ids (see inventory_counts()),
+    built_level_lists[n], money_list[n] and bonus_coin_counts[n] go with it. Money is not
+    checked, same as level_check(). Returns one 142 bit mask per inventory, bit (level - 1)
+    set when that level can be built; mask_levels() turns a row into level numbers.
+    The inventories are bit-sliced: each requirement slot becomes one int with a bit per
+    inventory, so every level is checked for all N inventories with a few big int ANDs.
+    """
+    # The per inventory bits are set in bytearrays and turned into ints once at the end
+    width = len(count_rows) // 8 + 1
+    material_slots = [[slot_ids[(material_id, copy)] for copy in range(len(held_slots) - 1)] for material_id, held_slots in enumerate(material_held_masks)]
+    holder_bytes = [bytearray(width) for _ in slot_ids]
+    for row, counts in enumerate(count_rows):
+        byte, row_bit = row >> 3, 1 << (row & 7)
+        for material_id, count in enumerate(counts):
+            if count:
+                for slot in material_slots[material_id][:count]:
+                    holder_bytes[slot][byte] |= row_bit
+    built_bytes = [bytearray(width) for _ in possible_levels]
+    for row, built_levels in enumerate(built_level_lists):
+        byte, row_bit = row >> 3, 1 << (row & 7)
+        for level in built_levels:
+            built_bytes[level - 1][byte] |= row_bit
+    coin_bytes = bytearray(width)
+    for row, bonus_coin_count in enumerate(bonus_coin_counts):
+        if (bonus_coin_count > 1):
+            coin_bytes[row >> 3] |= 1 << (row & 7)
+    holders = [int.from_bytes(bits, "little") for bits in holder_bytes]
+    built_by = [int.from_bytes(bits, "little") for bits in built_bytes]
+    coin_holders = int.from_bytes(coin_bytes, "little")
+    everyone = (1 << len(count_rows)) - 1
+    rows = [0] * len(count_rows)
+    for level in possible_levels:
+        column = everyone & ~built_by[level - 1]
+        if level_table[level - 1].bonus_coin:
+            column &= coin_holders
+        for slot_bit, material in level_slot_order[level - 1]:
+            column &= holders[slot_bit.bit_length() - 1]
+        level_bit = 1 << (level - 1)
+        while column:
+            row_bit = column & -column
+            rows[row_bit.bit_length() - 1] |= level_bit
+            column ^= row_bit
+    return rows
+
 def name_check(name):
 
     
@@ -2259,6 +1863,185 @@ full_space_guide = [
     ["Cranky's Cabin"], #408
     ["M", "Ropes", "Ship Hold", "Squitter"] #409
     ]
+
+# The board as a directed graph. One step from a space goes to board_next[space], or for a
+# fork (board_next[space] == 0) to the board_forks[space] option picked at fork_prompts[space].
+board_forks = {9: [10, 254, 121], 12: [13, 24], 60: [61, 322], 124: [125, 271], 174: [339, 212, 195],
+               273: [274, 138], 304: [101, 175], 347: [348, 356], 371: [372, 100], 375: [393, 376]}
+fork_prompts = {
+    9: "Would you like to continue through Kongo Jungle or move to Lake Orangatanga, or move to Gangplank Galleon, 1 for KJ, 2 for LO, 3 for GpG\n",
+    12: "Would you like to continue through Kongo Jungle or move to Monkey Mines, 1 for KJ, 2 for MM",
+    60: "Would you like move to Gorilla Glacier or K3, 1 for GG, 2 for K3\n",
+    124: "Would you like to continue through Gangplank Galleon or move to Kremwood Forest, 1 for GpG, 2 for KF\n",
+    174: "Would you like to move to Razor Ridge, K. Rool's Keep, or Gloomy Gulch, 1 for RR, 2 for KRK, 3 for GlG\n",
+    273: "Would you like to continue through Kremwood Forest or move to Crocodile Core, 1 for KF, 2 for CrC\n",
+    304: "Would you move to Chimp Caverns or Krazy Kremland, 1 for CC, 2 for KK\n",
+    347: "Would you like to continue through Razor Ridge or move to Pacifica, 1 for RR, 2 for P\n",
+    371: "Would you like to continue through Pacifica or move to Kremkroc Industries Inc., 1 for P, 2 for KII\n",
+    375: "Would you like to move through Krematoa or KAOS Kore, 1 for K, 2 for KsK\n",
+    }
+# Steps that go somewhere other than the next space
+board_jumps = {23: 41, 40: 140, 80: 155, 92: 305, 120: 81, 137: 52, 154: 165, 194: 237, 211: 237, 231: 347,
+               236: 6, 253: 363, 270: 288, 287: 338, 321: 232, 338: 288, 355: 81, 392: 232, 409: 232,
+               # Back onto the board from the K. Rool and Queen Banana Bird spaces
+               1: 53, 2: 172, 3: 371, 4: 295}
+# Kremkroc Industries Inc. runs backwards from 100 to 92
+board_backwards = range(93, 101)
+# Every space a piece can be on without going through a gate
+board_spaces = list(range(6, 410))
+
+BoardGate = collections.namedtuple("BoardGate", ["door", "kind", "prompt"])
+# Doors that are only offered while gate_open(). Going through moves onto door and ends the
+# move, anything else carries on along the board (the first option at a fork).
+board_gates = {
+    1: BoardGate(1, "krool", "\nWould you like to fight King K. Rool again, 1 for Yes, 2 for No\n"),
+    2: BoardGate(2, "krool", "\nWould you like to fight Kaptain K. Rool again, 1 for Yes, 2 for No\n"),
+    3: BoardGate(3, "krool", "\nWould you like to fight Baron K. Roolenstein again, 1 for Yes, 2 for No\n"),
+    6: BoardGate(5, "finish", "Do you want to go to the start space (Yes or No)\n"),
+    53: BoardGate(1, "krool", "Would to fight King K. Rool, 1 for Yes, 2 for No\n"),
+    172: BoardGate(2, "krool", "Would to fight Kaptain K. Rool, 1 for Yes, 2 for No\n"),
+    295: BoardGate(4, "queen", "\nWould you like to visit Queen Banana Bird (Yes or No)\n"),
+    371: BoardGate(3, "krool", "Would you like to fight Baron K. Roolenstein, 1 for Yes, 2 for No\n"),
+    }
+# The levels that have to be built before each K. Rool's door opens
+krool_door_levels = {1: range(1, 41), 2: range(41, 88), 3: range(88, 143)}
+
+
+def compile_board():
+    board_next = list(range(1, len(full_space_guide) + 2))
+    board_next[0] = 0
+    for space in board_backwards:
+        board_next[space] = space - 1
+    for space, target in board_jumps.items():
+        board_next[space] = target
+    for space in board_forks:
+        board_next[space] = 0
+    return board_next
+
+board_next = compile_board()
+
+
+def board_step(space):
+    # The spaces one step from space can go to
+    if (board_next[space] == 0):
+        return board_forks[space]
+    return [board_next[space]]
+
+
+def walk_board(space, roll, policy=None):
+    """
+    Where roll steps from space end up, without any prompts. Gates are passed by, and at a
+    fork policy(space, options, steps left) picks the option, the first one if there is no policy.
+    """
+    board = board_next
+    while roll:
+        step = board[space]
+        if step == 0:
+            options = board_forks[space]
+            step = options[0] if policy is None else policy(space, options, roll)
+        space = step
+        roll -= 1
+    return space
+
+
+def board_landings(space, steps):
+    # Every space steps steps from space can end on, trying every way at the forks
+    if (steps <= reach_table.max_roll):
+        return set(reach_table.landings(space, steps))
+    spaces = {space}
+    for _ in range(steps):
+        spaces = {option for current in spaces for option in board_step(current)}
+    return spaces
+
+
+class ReachTable:
+    """
+    Every space a move of each roll up to max_roll can end on, from every space, with the
+    fork choices leading there. landings(space, roll) is {landing: [choices, ...]}, each
+    choices a flat tuple of (fork, option) pairs in the order the forks are passed.
+    Gates are passed by. The table is built once from board_next and kept in path,
+    tagged with a hash of the board so it's only rebuilt when the board tables change.
+    """
+    def __init__(self, path, max_roll=22):
+        self.path = path
+        self.max_roll = max_roll
+        self.table = None
+        self.lock = threading.Lock()
+
+    def board_hash(self):
+        board = json.dumps([board_next, sorted(board_forks.items()), self.max_roll])
+        return hashlib.sha1(board.encode()).hexdigest()
+
+    def load(self):
+        with self.lock:
+            if self.table is None:
+                digest = self.board_hash()
+                try:
+                    with open(self.path) as table_file:
+                        saved = json.load(table_file)
+                    if (saved["board"] == digest):
+                        self.table = [[{landing: [tuple(choices) for choices in paths] for landing, paths in reach}
+                                       for reach in rolls] for rolls in saved["table"]]
+                except (OSError, ValueError, KeyError):
+                    pass
+                if self.table is None:
+                    self.table = self.build()
+                    self.save(digest)
+        return self.table
+
+    def build(self):
+        table = [[{space: [()]}] for space in range(len(board_next))]
+        for roll in range(1, self.max_roll + 1):
+            for space in range(1, len(board_next)):
+                fork = (board_next[space] == 0)
+                reach = {}
+                for option in board_step(space):
+                    for landing, paths in table[option][roll - 1].items():
+                        if fork:
+                            paths = [(space, option) + choices for choices in paths]
+                        reach.setdefault(landing, []).extend(paths)
+                table[space].append(reach)
+        return table
+
+    def save(self, digest):
+        saved = {"board": digest,
+                 "table": [[[[landing, paths] for landing, paths in reach.items()] for reach in rolls] for rolls in self.table]}
+        # Best effort, a table that can't be written stays in memory and is rebuilt next launch
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + ".tmp", "w") as table_file:
+                json.dump(saved, table_file, separators=(",", ":"))
+            os.replace(self.path + ".tmp", self.path)
+        except OSError:
+            pass
+
+    def landings(self, space, roll):
+        return self.load()[space][roll]
+
+    def chances(self, space, roll, policy=None):
+        """
+        {landing: chance} for the move. policy maps a fork to weights for its options in
+        board_forks order, every option at forks it leaves out is equally likely.
+        """
+        chances = {}
+        for landing, paths in self.landings(space, roll).items():
+            chance = 0.0
+            for choices in paths:
+                path_chance = 1.0
+                for index in range(0, len(choices), 2):
+                    fork, option = choices[index], choices[index + 1]
+                    weights = None if policy is None else policy.get(fork)
+                    if weights is None:
+                        path_chance /= len(board_forks[fork])
+                    else:
+                        path_chance *= weights[board_forks[fork].index(option)] / sum(weights)
+                chance += path_chance
+            if (chance > 0):
+                chances[landing] = chance
+        return chances
+
+reach_table = ReachTable("assets/Cache/reach.json")
+
 money_brackets = [
     # $50
     [1, 2, 3, 4, 5, 6, 41, 42, 43, 44, 45, 46, 88, 89, 90, 91 ,92, 93],
@@ -2806,73 +2589,954 @@ possible_levels = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18
                    71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142]
 regular_boss_levels = [6, 12, 19, 26, 33, 39, 46, 52, 59, 66, 72, 79, 93, 99, 105, 111, 117, 123, 130]
 final_boss_levels = [40, 81, 87, 136, 142]
+bonus_coin_levels = [82, 83, 84, 85, 86, 87, 137, 138, 139, 140, 141, 142]
+# Bonus Coins paid out by the reward checks at the end of a turn for building each level
+bonus_coin_awards = {6: 1, 12: 1, 19: 1, 26: 1, 33: 1, 39: 2, 40: 1, 46: 1, 52: 1, 59: 1, 66: 1, 72: 1, 79: 1, 81: 1,
+                     93: 1, 99: 1, 105: 1, 111: 1, 117: 1, 124: 1, 130: 1, 136: 1}
+# First level of each world, in world_key order
+world_first_levels = [1, 7, 13, 20, 27, 34, 41, 47, 53, 60, 67, 73, 80, 82, 88, 94, 100, 106, 112, 118, 124, 131, 137]
 
-def distance(dist, inventory, levels_built, zero_bool):
-    #Calculates the levels you are {dist} away from building
-    rem_levels = list(set(possible_levels) - set(levels_built))
-    in_range = []
-    for levels in rem_levels:
-        level_mats = material_list[levels - 1]
-        req_mats = len(level_mats)
-        aqq_mats = 0
-        
-        if levels != 39 and levels != 136:
-            for mats in level_mats:
-                if mats in inventory:
-                    aqq_mats += 1
-            if (req_mats - aqq_mats <= dist):
-                r = [levels, req_mats - aqq_mats]
-                in_range.append(r)
+LevelInfo = collections.namedtuple("LevelInfo", ["name", "price", "bonus_coin", "boss_kind", "world", "bonus_difficulty"])
+
+
+def compile_level_table():
+    """
+    Everything known about a level in one place, read as level_table[level - 1].
+    boss_kind is "" for normal levels, "boss" for world bosses and "final" for final bosses,
+    world is the world_key number.
+    """
+    prices = {}
+    for bracket, levels in enumerate(money_brackets):
+        for level in levels:
+            prices[level] = 50 * (bracket + 1)
+    table = []
+    world = 0
+    for level in possible_levels:
+        if (world < len(world_first_levels)) and (level == world_first_levels[world]):
+            world += 1
+        if level in final_boss_levels:
+            boss_kind = "final"
+        elif level in regular_boss_levels:
+            boss_kind = "boss"
         else:
-            for mats in level_mats:
-                if (mats in inventory) and (mats != "Boss"):
-                    aqq_mats += 1
-            if operator.countOf(inventory,'Boss') == 1:
-                aqq_mats += 1
-            elif operator.countOf(inventory,'Boss') > 1:
-                aqq_mats += 2
-            if (req_mats - aqq_mats <= dist):
-                r = [levels, req_mats - aqq_mats]
-                in_range.append(r)
+            boss_kind = ""
+        table.append(LevelInfo(level_list[level - 1][0], prices[level], level in bonus_coin_levels, boss_kind, world, bonus_difficulties[level - 1]))
+    return table
+
+level_table = compile_level_table()
+
+def compile_level_requirements():
+    """
+    Compiles material_list once for level_check().
+    Every material gets an id and each level's materials become a count vector over
+    those ids. Each (material, nth copy) a level can ask for is a bit slot, so a level's
+    needs and an inventory are both bitmasks. slot_level_masks[slot] has bit (level - 1)
+    set for every level that needs that slot, and material_held_masks[material_id][n] is
+    the slots filled by holding n copies.
+    """
+    material_ids = {name: material_id for material_id, name in enumerate(name_list)}
+    level_requirements = []
+    for materials in material_list:
+        counts = [0] * len(name_list)
+        for material in materials:
+            counts[material_ids[material]] += 1
+        level_requirements.append(counts)
+    material_copies = [max(counts[material_id] for counts in level_requirements) for material_id in range(len(name_list))]
+    slot_ids = {}
+    material_held_masks = []
+    for material_id, copies in enumerate(material_copies):
+        held_slots = [0]
+        for copy in range(copies):
+            slot_ids[(material_id, copy)] = len(slot_ids)
+            held_slots.append(held_slots[-1] | 1 << slot_ids[(material_id, copy)])
+        material_held_masks.append(held_slots)
+    level_slot_masks = []
+    slot_level_masks = [0] * len(slot_ids)
+    for level, counts in enumerate(level_requirements, start=1):
+        slot_mask = 0
+        for material_id, count in enumerate(counts):
+            for copy in range(count):
+                slot_mask |= 1 << slot_ids[(material_id, copy)]
+                slot_level_masks[slot_ids[(material_id, copy)]] |= 1 << (level - 1)
+        level_slot_masks.append(slot_mask)
+    return material_ids, level_requirements, slot_ids, material_held_masks, level_slot_masks, slot_level_masks
+
+material_ids, level_requirements, slot_ids, material_held_masks, level_slot_masks, slot_level_masks = compile_level_requirements()
+all_slots_mask = (1 << len(slot_ids)) - 1
+
+
+def compile_level_slot_order():
+    # (slot bit, material) for each card a level asks for, in material_list order
+    order = []
+    for materials in material_list:
+        copies = collections.Counter()
+        slots = []
+        for material in materials:
+            slots.append((1 << slot_ids[(material_ids[material], copies[material])], material))
+            copies[material] += 1
+        order.append(slots)
+    return order
+
+level_slot_order = compile_level_slot_order()
+
+def levels_mask(levels):
+    mask = 0
+    for level in levels:
+        mask |= 1 << (level - 1)
+    return mask
+
+
+def mask_levels(mask):
+    levels = []
+    while mask:
+        level_bit = mask & -mask
+        levels.append(level_bit.bit_length())
+        mask ^= level_bit
+    return levels
+
+all_levels_mask = levels_mask(possible_levels)
+bonus_coin_levels_mask = levels_mask(bonus_coin_levels)
+
+
+def inventory_counts(inventory):
+    # Count vector over material ids, tokens and unknown names are ignored
+    counts = [0] * len(name_list)
+    for card in inventory:
+        material_id = material_ids.get(card)
+        if material_id is not None:
+            counts[material_id] += 1
+    return counts
+
+
+def inventory_mask(inventory):
+    # Holding n copies of a material fills its first n slots
+    mask = 0
+    for card, count in collections.Counter(inventory).items():
+        material_id = material_ids.get(card)
+        if material_id is not None:
+            held_slots = material_held_masks[material_id]
+            mask |= held_slots[min(count, len(held_slots) - 1)]
+    return mask
+
+
+# Tokens are held alongside materials, up to the character's token limit
+token_list = ["Golden Feather", "Camera Piece", "Crystal Coconut", "Banana Bird", "Flipped Bird"]
+# Flipped Birds are spent Banana Birds, they don't count toward the limit or earn money
+limited_tokens = token_list[:4]
+# Money earned per limited token at the end of each turn
+token_income = 20
+
+
+class Hand(list):
+    """
+    A player's inventory. Behaves like the plain list it replaces, but keeps a count per
+    card and tells its listeners about every card that comes in or goes out with
+    card_added(card, count) / card_removed(card, count), count being the new total.
+    Sorting and reordering send nothing.
+    """
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self.counts = collections.Counter(self)
+        self.listeners = []
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def cards_added(self, cards):
+        for card in cards:
+            self.counts[card] += 1
+            for listener in self.listeners:
+                listener.card_added(card, self.counts[card])
+
+    def cards_removed(self, cards):
+        for card in cards:
+            self.counts[card] -= 1
+            count = self.counts[card]
+            if count == 0:
+                del self.counts[card]
+            for listener in self.listeners:
+                listener.card_removed(card, count)
+
+    def append(self, card):
+        super().append(card)
+        self.cards_added([card])
+
+    def extend(self, cards):
+        cards = list(cards)
+        super().extend(cards)
+        self.cards_added(cards)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self.cards_added([card])
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self.cards_removed([card])
+        return card
+
+    def remove(self, card):
+        super().remove(card)
+        self.cards_removed([card])
+
+    def clear(self):
+        cards = list(self)
+        super().clear()
+        self.cards_removed(cards)
+
+    def __setitem__(self, index, cards):
+        if isinstance(index, slice):
+            cards = list(cards)
+            old_cards = self[index]
+            new_cards = cards
+        else:
+            old_cards = [self[index]]
+            new_cards = [cards]
+        super().__setitem__(index, cards)
+        self.cards_removed(old_cards)
+        self.cards_added(new_cards)
+
+    def __delitem__(self, index):
+        old_cards = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self.cards_removed(old_cards)
+
+    def token_count(self):
+        """Tokens held that count toward the token limit, straight from counts."""
+        return sum(self.counts[token] for token in limited_tokens)
+
+    def spend(self, card):
+        """Removes the first copy of card, returns False if there is none."""
+        if (self.counts[card] == 0):
+            return False
+        self.remove(card)
+        return True
+
+
+class BuildTracker:
+    """
+    Keeps the set of levels a Hand can build up to date, so main() does not have to run
+    level_check() from scratch after every change. Each level counts the requirement
+    slots it is still missing, like a reference count, and sits in buckets[missing].
+    The inverted index slot_levels lists the levels using each (material, nth copy)
+    slot, so a card coming in or going out only moves the levels using that slot one
+    bucket down or up. Two Boss cards for levels 39 and 136 are just two slots.
+    Built levels and the Bonus Coin rule are applied when asking.
+    """
+    def __init__(self, hand):
+        self.slot_levels = [mask_levels(levels) for levels in slot_level_masks]
+        self.reset(hand)
+        hand.subscribe(self)
+
+    def reset(self, hand):
+        self.hand = hand
+        held = inventory_mask(hand)
+        self.missing = [bin(slot_mask & ~held).count("1") for slot_mask in level_slot_masks]
+        self.buckets = [set() for _ in range(max(len(materials) for materials in material_list) + 1)]
+        for level in possible_levels:
+            self.buckets[self.missing[level - 1]].add(level)
+        self.ready = self.buckets[0]
+
+    def card_added(self, card, count):
+        slot = slot_ids.get((material_ids.get(card), count - 1))
+        if slot is not None:
+            for level in self.slot_levels[slot]:
+                self.buckets[self.missing[level - 1]].discard(level)
+                self.missing[level - 1] -= 1
+                self.buckets[self.missing[level - 1]].add(level)
+
+    def card_removed(self, card, count):
+        slot = slot_ids.get((material_ids.get(card), count))
+        if slot is not None:
+            for level in self.slot_levels[slot]:
+                self.buckets[self.missing[level - 1]].discard(level)
+                self.missing[level - 1] += 1
+                self.buckets[self.missing[level - 1]].add(level)
+
+    def discard_cost(self, card, built, copies_gone=0):
+        """
+        How much losing one copy of card would hurt, after copies_gone other copies of it
+        are already gone. The slot it empties pushes every unbuilt level using it one card
+        further away; each level counts its level_value() divided by how many cards it
+        would then be missing, so levels close to buildable count the most. Spare copies
+        cost 0.
+        """
+        material_id = material_ids.get(card)
+        count = self.hand.counts[card] - copies_gone
+        slot = slot_ids.get((material_id, count - 1))
+        if slot is None:
+            return 0.0
+        cost = 0.0
+        for level in self.slot_levels[slot]:
+            if level not in built:
+                # The copies already gone emptied this level's slots above this one too
+                gone = max(min(level_requirements[level - 1][material_id], count + copies_gone) - count, 0)
+                cost += level_value(level) / (self.missing[level - 1] + gone + 1)
+        return cost
+
+    def card_gain(self, card, built):
+        """
+        How much one more copy of card would help, the other way round from discard_cost():
+        the slot it fills brings every unbuilt level using it one card closer.
+        """
+        slot = slot_ids.get((material_ids.get(card), self.hand.counts[card]))
+        if slot is None:
+            return 0.0
+        gain = 0.0
+        for level in self.slot_levels[slot]:
+            if level not in built:
+                gain += level_value(level) / self.missing[level - 1]
+        return gain
+
+    def buildable(self, built_levels, bonus_coin_count):
+        """
+        Same answer as level_check() for the tracked hand.
+        """
+        built = set(built_levels)
+        options = []
+        for level in sorted(self.ready):
+            if (level in built) or ((bonus_coin_count <= 1) and level_table[level - 1].bonus_coin):
+                continue
+            options.append(level)
+        return options
+
+
+BuildPlan = collections.namedtuple("BuildPlan", ["levels", "score", "price", "exact"])
+# Most states pack_levels() memoizes before it gives up on the exact answer, about 50ms worth
+plan_state_limit = 10000
+
+
+class PlanTooLarge(Exception):
+    pass
+build_objectives = {"count": "Most levels", "bonus": "Most Bonus Coins earned", "world": "Most worlds finished"}
+
+
+def plan_builds(inventory, built_levels, money, bonus_coin_count, objective="count"):
+    """
+    Finds the set of levels that can be built together from one inventory, when building
+    one level would use up cards another one needs. Each level must be paid for out of
+    money, and Lost World / Krematoa levels use 2 Bonus Coins each. objective is one of
+    build_objectives, ties go to more levels and then to the cheaper set.
+    """
+    candidates = level_check(inventory, built_levels, bonus_coin_count, money)
+    counts = inventory_counts(inventory)
+    money = max(money, 0)
+    bonus_coin_count = max(bonus_coin_count, 0)
+    if (objective == "world"):
+        # Worlds whose every unbuilt level is buildable right now are the only ones that can be finished
+        built = set(built_levels)
+        worlds = {}
+        for level in candidates:
+            worlds.setdefault(level_table[level - 1].world, set()).add(level)
+        finishable = [levels for world, levels in worlds.items() if all((level in levels) or (level in built) for level in possible_levels if level_table[level - 1].world == world)]
+        best = None
+        exact = True
+        # Every packing shares one plan_state_limit, and each call also counts against it
+        budget = [plan_state_limit]
+        cut_short = False
+        for size in range(len(finishable), -1, -1):
+            for worlds_kept in itertools.combinations(finishable, size):
+                if budget[0] <= 0:
+                    cut_short = True
+                    break
+                forced = set().union(*worlds_kept)
+                plan = pack_levels(candidates, forced, counts, money, bonus_coin_count, lambda level: 0, budget)
+                if plan is not None:
+                    exact = exact and plan[2]
+                    score = (size, len(plan[0]), -plan[1])
+                    if (best is None) or (score > best[0]):
+                        best = (score, plan)
+            if (best is not None) or cut_short:
+                break
+        if cut_short:
+            # Too many ways to pick the worlds: add them cheapest first while they still fit
+            exact = False
+            forced = set()
+            finished = 0
+            left = (counts, money, bonus_coin_count)
+            for levels in sorted(finishable, key=lambda levels: (sum(level_table[level - 1].price for level in levels), len(levels))):
+                spent = spend_levels(levels, *left)
+                if spent is not None:
+                    forced |= levels
+                    finished += 1
+                    left = spent
+            plan = pack_levels(candidates, forced, counts, money, bonus_coin_count, lambda level: 0, budget)
+            score = (finished, len(plan[0]), -plan[1])
+            if (best is None) or (score > best[0]):
+                best = (score, plan)
+        return BuildPlan(best[1][0], best[0][0], best[1][1], exact)
+    if (objective == "bonus"):
+        gain = lambda level: bonus_coin_awards.get(level, 0)
+    else:
+        gain = lambda level: 1
+    levels, price, exact = pack_levels(candidates, set(), counts, money, bonus_coin_count, gain)
+    return BuildPlan(levels, sum(gain(level) for level in levels), price, exact)
+
+
+def spend_levels(levels, counts, money, bonus_coin_count):
+    # (counts, money, bonus_coin_count) left after building every level in levels, or None if they don't fit
+    counts = list(counts)
+    for level in levels:
+        for material_id, count in enumerate(level_requirements[level - 1]):
+            counts[material_id] -= count
+        money -= level_table[level - 1].price
+        bonus_coin_count -= 2 if level_table[level - 1].bonus_coin else 0
+    if (min(counts) < 0) or (money < 0) or (bonus_coin_count < 0):
+        return None
+    return counts, money, bonus_coin_count
+
+
+def pack_levels(candidates, forced, counts, money, bonus_coin_count, gain, budget=None):
+    """
+    Best (levels, price, exact) for plan_builds() that includes every level in forced, or
+    None if forced does not fit. Sets are compared by total gain, then size, then price.
+    Levels whose cards nobody else wants only compete for money and coins, so they are
+    solved once as a knapsack table. The contested levels are searched in order with
+    memoization on the cards, money and coins left, each clipped to what the levels
+    after it could still use, so different routes to the same leftovers are solved once.
+    Past plan_state_limit states it settles for a greedy pick, and exact is False.
+    budget ([states left]) lets several calls share that limit.
+    """
+    if budget is None:
+        budget = [plan_state_limit]
+    # Setting up costs about a state per candidate, whether or not forced fits
+    budget[0] -= len(candidates)
+    spent = spend_levels(forced, counts, money, bonus_coin_count)
+    if spent is None:
+        return None
+    counts, money, bonus_coin_count = spent
+    options = [level for level in candidates if level not in forced]
+    demand = [0] * len(counts)
+    for level in options:
+        for material_id, count in enumerate(level_requirements[level - 1]):
+            demand[material_id] += count
+    contested = {level: set(material_id for material_id, count in enumerate(level_requirements[level - 1]) if count and (demand[material_id] > counts[material_id])) for level in options}
+    free = [level for level in options if not contested[level]]
+
+    # Knapsack over money (in $50 steps, every price is a multiple of 50) and coins for the free levels
+    cash_steps = money // 50
+    free_table = [[(0, 0, 0, ())] * (bonus_coin_count + 1) for _ in range(cash_steps + 1)]
+    for level in free:
+        info = level_table[level - 1]
+        price_steps = info.price // 50
+        coin_cost = 2 if info.bonus_coin else 0
+        for cash in range(cash_steps, price_steps - 1, -1):
+            for coins in range(bonus_coin_count, coin_cost - 1, -1):
+                rest = free_table[cash - price_steps][coins - coin_cost]
+                taken = (rest[0] + gain(level), rest[1] + 1, rest[2] - info.price, rest[3] + (level,))
+                if taken[:3] > free_table[cash][coins][:3]:
+                    free_table[cash][coins] = taken
+
+    # Contested levels fighting over the same cards go next to each other, so each
+    # contested material drops out of the state as early as possible
+    options = [level for level in options if contested[level]]
+    users = collections.Counter(material_id for level in options for material_id in contested[level])
+    ordered = []
+    opened = set()
+    while options:
+        level = min(options, key=lambda level: (len(contested[level] - opened), -sum(1 for material_id in contested[level] if users[material_id] == 1)))
+        options.remove(level)
+        ordered.append(level)
+        opened |= contested[level]
+        users.subtract(contested[level])
+    options = ordered
+    materials = sorted(opened)
+    slot = {material_id: position for position, material_id in enumerate(materials)}
+    needs = [[(slot[material_id], level_requirements[level - 1][material_id]) for material_id in contested[level]] for level in options]
+    prices = [level_table[level - 1].price for level in options]
+    coin_costs = [2 if level_table[level - 1].bonus_coin else 0 for level in options]
+    gains = [gain(level) for level in options]
+    # What options[index:] and the free levels could still use, to clip each state with
+    suffix_demand = [[0] * len(materials)]
+    suffix_price = [min(money - money % 50, sum(level_table[level - 1].price for level in free))]
+    suffix_coins = [min(bonus_coin_count, sum(2 for level in free if level_table[level - 1].bonus_coin))]
+    for index in range(len(options) - 1, -1, -1):
+        suffix_demand.insert(0, list(suffix_demand[0]))
+        for position, count in needs[index]:
+            suffix_demand[0][position] += count
+        suffix_price.insert(0, suffix_price[0] + prices[index])
+        suffix_coins.insert(0, suffix_coins[0] + coin_costs[index])
+    # The cards held are packed 6 bits per contested material into one int (no hand has 64 of
+    # a card), and each level's needs as (bit shift, count, what the levels after it want)
+    fields = [[(position * 6, count, suffix_demand[index + 1][position]) for position, count in needs[index]] for index in range(len(options))]
+    memo = {}
+
+    def best_from(index, held, cash, coins):
+        # held comes in already clipped to suffix_demand[index]
+        if index == len(options):
+            return free_table[min(cash, suffix_price[index]) // 50][min(coins, suffix_coins[index])]
+        cash = min(cash, suffix_price[index])
+        coins = min(coins, suffix_coins[index])
+        key = (index, cash, coins, held)
+        result = memo.get(key)
+        if result is not None:
+            return result
+        if len(memo) >= budget[0]:
+            raise PlanTooLarge()
+        # Only the cards options[index] uses can be over what the later levels want
+        kept = held
+        left = held
+        fits = (prices[index] <= cash) and (coin_costs[index] <= coins)
+        for shift, count, later_want in fields[index]:
+            have = (held >> shift) & 63
+            if have > later_want:
+                kept -= (have - later_want) << shift
+            if have < count:
+                fits = False
+            else:
+                left -= (have - min(have - count, later_want)) << shift
+        result = best_from(index + 1, kept, cash, coins)
+        if fits:
+            rest = best_from(index + 1, left, cash - prices[index], coins - coin_costs[index])
+            taken = (rest[0] + gains[index], rest[1] + 1, rest[2] - prices[index], (options[index],) + rest[3])
+            if taken[:3] > result[:3]:
+                result = taken
+        memo[key] = result
+        return result
+
+    held = sum(min(counts[material_id], want) << (position * 6) for position, (material_id, want) in enumerate(zip(materials, suffix_demand[0])))
+    exact = True
+    try:
+        result = best_from(0, held, money - money % 50, bonus_coin_count)
+        budget[0] -= len(memo)
+    except PlanTooLarge:
+        budget[0] = 0
+        # Too many combinations to try them all in time: take the contested levels one by
+        # one, most gain for the scarcest cards first, and fill up with the free levels.
+        # Then keep retrying with one of the picked levels moved to the back of the line
+        # while that finds a better set.
+        exact = False
+        scarcity = lambda index: (-gains[index], sum(count * suffix_demand[0][position] / max(counts[materials[position]], 1) for position, count in needs[index]), prices[index])
+
+        def pack_in_order(order):
+            held = [counts[material_id] for material_id in materials]
+            cash = money - money % 50
+            coins = bonus_coin_count
+            total = 0
+            taken = ()
+            for index in order:
+                if (prices[index] <= cash) and (coin_costs[index] <= coins) and all(held[position] >= count for position, count in needs[index]):
+                    for position, count in needs[index]:
+                        held[position] -= count
+                    cash -= prices[index]
+                    coins -= coin_costs[index]
+                    total += gains[index]
+                    taken += (index,)
+            rest = free_table[cash // 50][coins]
+            packed = (total + rest[0], len(taken) + rest[1], rest[2] - sum(prices[index] for index in taken), tuple(options[index] for index in taken) + rest[3])
+            return packed, taken
+
+        order = sorted(range(len(options)), key=scarcity)
+        result, taken = pack_in_order(order)
+        improved = True
+        while improved:
+            improved = False
+            for index in taken:
+                retry = [other for other in order if other != index] + [index]
+                packed, packed_taken = pack_in_order(retry)
+                if packed[:3] > result[:3]:
+                    order, result, taken = retry, packed, packed_taken
+                    improved = True
+                    break
+    levels = sorted(forced | set(result[3]))
+    return levels, sum(level_table[level - 1].price for level in levels), exact
+
+
+def describe_plan(plan):
+    if not plan.levels:
+        return "nothing"
+    return ", ".join("#{} {}".format(level, level_table[level - 1].name) for level in plan.levels)
+
+
+def material_spaces():
+    # Every "M" space each material can be picked up on
+    spaces = {}
+    for space, guide in enumerate(full_space_guide, start=1):
+        if guide[0] == "M":
+            for material in guide[1:]:
+                spaces.setdefault(material, []).append(space)
+    return spaces
+
+material_supply = material_spaces()
+# Cards no space gives, with the level whose building hands them out
+level_earned_cards = {"Gunship": 79}
+
+SupplySpace = collections.namedtuple("SupplySpace", ["space", "steps"])
+
+
+@functools.lru_cache(maxsize=512)
+def board_steps_from(space):
+    # Fewest steps from space to every space, going whichever way is shorter at forks (-1 if out of reach)
+    steps = [-1] * len(board_next)
+    steps[space] = 0
+    frontier = [space]
+    while frontier:
+        stepped = []
+        for current in frontier:
+            for option in board_step(current):
+                if steps[option] == -1:
+                    steps[option] = steps[current] + 1
+                    stepped.append(option)
+        frontier = stepped
+    return tuple(steps)
+
+
+def nearest_supply(material, space, count=3):
+    """
+    The count spaces giving material that are the fewest steps ahead of space, as
+    SupplySpace(space, steps), nearest first. Empty if no "M" space gives it.
+    """
+    steps = board_steps_from(space)
+    found = [SupplySpace(supply, steps[supply]) for supply in material_supply.get(material, []) if steps[supply] > 0]
+    found.sort(key=lambda supply: supply.steps)
+    return found[:count]
+
+
+class TurnEstimator:
+    """
+    Expected turns until a level's missing cards have all been picked up, using the board
+    as a Markov chain. One turn is a roll of the character's die, looked up in
+    reach_table with an even chance at every fork. Landing on an "M" space gives its cards.
+    For each (space, die) the chance of landing on a space with a given material is
+    worked out turn by turn for the first horizon turns, then the long run landing
+    chances are used. Materials are treated as independent of each other.
+    Everything is cached, so a new inventory only costs the levels whose needs changed.
+    """
+    def __init__(self, horizon=30, max_turns=1000):
+        self.horizon = horizon
+        self.max_turns = max_turns
+        self.landing = {}
+        self.long_run = {}
+        self.curves = {}
+        self.estimates = {}
+
+    def landing_table(self, die, policy=None):
+        """
+        landing_table(die)[space] is {landing space: chance} for one turn from space, the
+        sparse transition matrix of the chain. policy is passed on to reach_table.chances().
+        """
+        key = (die, None if policy is None else tuple(sorted((fork, tuple(weights)) for fork, weights in policy.items())))
+        table = self.landing.get(key)
+        if table is None:
+            table = {}
+            # The K. Rool and Queen Banana Bird spaces are included so a turn can start there
+            for space in range(1, len(board_next)):
+                spread = collections.Counter()
+                for roll in range(1, die + 1):
+                    for landing, chance in reach_table.chances(space, roll, policy).items():
+                        spread[landing] += chance / die
+                table[space] = spread
+            self.landing[key] = table
+        return table
+
+    def advance(self, spread, die, policy=None):
+        table = self.landing_table(die, policy)
+        moved = collections.Counter()
+        for space, chance in spread.items():
+            for landing, step_chance in table[space].items():
+                moved[landing] += chance * step_chance
+        return moved
+
+    def spread_after(self, space, die, turns, policy=None):
+        # {space: chance} of where a piece on space is after turns turns
+        spread = collections.Counter({space: 1.0})
+        for _ in range(turns):
+            spread = self.advance(spread, die, policy)
+        return spread
+
+    def long_run_spread(self, die):
+        spread = self.long_run.get(die)
+        if spread is None:
+            spread = collections.Counter({space: 1 / len(board_spaces) for space in board_spaces})
+            for _ in range(200):
+                moved = self.advance(spread, die)
+                change = sum(abs(moved[space] - spread[space]) for space in board_spaces)
+                spread = moved
+                if change < 1e-9:
+                    break
+            self.long_run[die] = spread
+        return spread
+
+    def material_chances(self, spread):
+        return {material: sum(spread[space] for space in spaces) for material, spaces in material_supply.items()}
+
+    def hit_curves(self, space, die):
+        """
+        (per turn chances, long run chance) of landing on each material, starting on space.
+        """
+        curves = self.curves.get((space, die))
+        if curves is None:
+            spread = collections.Counter({space: 1.0})
+            per_turn = []
+            for _ in range(self.horizon):
+                spread = self.advance(spread, die)
+                per_turn.append(self.material_chances(spread))
+            curves = (per_turn, self.material_chances(self.long_run_spread(die)))
+            self.curves[(space, die)] = curves
+        return curves
+
+    def expected_turns(self, space, die, needed):
+        """
+        Expected turns from space until every card in needed (a list, repeats count) has
+        been landed on, or None when that is beyond max_turns or no space gives one of them.
+        """
+        key = (space, die, tuple(sorted(needed)))
+        if key in self.estimates:
+            return self.estimates[key]
+        per_turn, long_run = self.hit_curves(space, die)
+        if any(long_run.get(material, 0.0) == 0 for material in needed):
+            self.estimates[key] = None
+            return None
+        # Chance of having 0, 1, ... copies of each material, the last entry being "enough"
+        copies = {material: [1.0] + [0.0] * count for material, count in collections.Counter(needed).items()}
+        expected = 0.0
+        for chances in per_turn:
+            done = 1.0
+            for counts in copies.values():
+                done *= counts[-1]
+            if (1 - done < 1e-4):
+                break
+            expected += 1 - done
+            for material, counts in copies.items():
+                hit = chances.get(material, 0.0)
+                for index in range(len(counts) - 1, 0, -1):
+                    counts[index] = counts[index] * (1 if index == len(counts) - 1 else 1 - hit) + counts[index - 1] * hit
+                counts[0] *= 1 - hit
+        else:
+            expected += self.tail_turns(copies, long_run)
+        if expected > self.max_turns:
+            expected = None
+        self.estimates[key] = expected
+        return expected
+
+    def tail_turns(self, copies, chances):
+        """
+        Expected turns still to go from the copies held, when every turn has the same
+        chances. Worked out in closed form instead of turn by turn: the chance that a
+        material isn't done after t more turns is a polynomial in t times (1 - hit) ** t,
+        so the chance that something isn't done expands into terms whose sum over every t
+        is a geometric series, sum(t ** k * R ** t) = R / (1 - R) * sum(C(k, j) * that for j < k).
+        """
+        # Each term of product(1 - not done chance) as ([polynomial coefficients in t], R)
+        terms = [([1.0], 1.0)]
+        for material, counts in copies.items():
+            need = len(counts) - 1
+            if (counts[-1] >= 1.0):
+                continue
+            hit = min(chances[material], 1 - 1e-12)
+            miss = 1 - hit
+            # Not done: holding i copies and landing on fewer than need - i more, in binomial terms C(t, j)
+            poly = [0.0]
+            for j in range(need):
+                weight = sum(counts[:need - j]) * (hit / miss) ** j
+                binomial = [1.0]
+                for factor in range(j):
+                    binomial = [(a - factor * b) / (factor + 1) for a, b in zip([0.0] + binomial, binomial + [0.0])]
+                poly = [a + weight * b for a, b in itertools.zip_longest(poly, binomial, fillvalue=0.0)]
+            stepped = []
+            for term_poly, ratio in terms:
+                stepped.append((term_poly, ratio))
+                product = [0.0] * (len(term_poly) + len(poly) - 1)
+                for a_index, a in enumerate(term_poly):
+                    for b_index, b in enumerate(poly):
+                        product[a_index + b_index] -= a * b
+                stepped.append((product, ratio * miss))
+            terms = stepped
+        tail = 0.0
+        # The first term is the 1 of "1 - chance everything is done", which cancels
+        for term_poly, ratio in terms[1:]:
+            sums = [1 / (1 - ratio)]
+            for k in range(1, len(term_poly)):
+                sums.append(ratio / (1 - ratio) * sum(math.comb(k, j) * sums[j] for j in range(k)))
+            tail -= sum(a * power_sum for a, power_sum in zip(term_poly, sums))
+        return tail
+
+turn_estimator = TurnEstimator()
+
+
+# A Bonus Coin a level pays out counts like this many dollars of level price when scoring cards
+level_coin_value = 150
+
+
+def level_value(level):
+    return level_table[level - 1].price + level_coin_value * bonus_coin_awards.get(level, 0)
+
+
+def rank_discards(tracker, built_levels):
+    """
+    The tracked hand's material cards as (hand number, card, cost), cheapest to lose first.
+    Each copy of a card is costed as if the copies listed before it were discarded too,
+    so only spare copies come out free. Tokens have their own limit and are left out.
+    """
+    built = set(built_levels)
+    seen = collections.Counter()
+    ranked = []
+    for position, card in enumerate(tracker.hand, start=1):
+        if card in material_ids:
+            ranked.append((position, card, tracker.discard_cost(card, built, seen[card])))
+            seen[card] += 1
+    ranked.sort(key=lambda entry: entry[2])
+    return ranked
+
+
+class ForkAdvisor:
+    """
+    Scores the ways out of a fork by the cards the next turns should pick up. An "M" space
+    is worth the BuildTracker.card_gain() of its cards. Looking turns turns ahead, the rest
+    of this move and every later one take the best way at each fork, worked out by dynamic
+    programming over reach_table: best_after(die, n)[space] averages, over the rolls, the
+    best landing's worth plus best_after(die, n - 1)[landing].
+    Everything is kept until the hand or the built levels change.
+    """
+    def __init__(self, turns=3):
+        self.turns = turns
+        self.signature = None
+        self.worth = None
+        self.best = {}
+        self.advice = {}
+
+    def sync(self, tracker, built_levels):
+        signature = (tuple(sorted(tracker.hand.counts.items())), tuple(sorted(set(built_levels))))
+        if signature != self.signature:
+            self.signature = signature
+            built = set(built_levels)
+            gains = {}
+            self.worth = [0.0] * len(board_next)
+            for space, guide in enumerate(full_space_guide, start=1):
+                if guide[0] == "M":
+                    for material in guide[1:]:
+                        if material not in gains:
+                            gains[material] = tracker.card_gain(material, built)
+                        self.worth[space] += gains[material]
+            self.best = {}
+            self.advice = {}
+
+    def best_after(self, die, turns):
+        # best_after(die, turns)[space] is the worth turns more turns from space should pick up
+        best = self.best.get((die, turns))
+        if best is None:
+            best = [0.0] * len(board_next)
+            if turns > 0:
+                later = self.best_after(die, turns - 1)
+                for space in range(1, len(board_next)):
+                    total = 0.0
+                    for roll in range(1, die + 1):
+                        total += max(self.worth[landing] + later[landing] for landing in board_landings(space, roll))
+                    best[space] = total / die
+            self.best[(die, turns)] = best
+        return best
+
+    def advise(self, space, steps, die, tracker, built_levels):
+        """
+        [(option, score)] for the fork on space in board_forks order, with steps steps
+        (this one included) left to move this turn.
+        """
+        self.sync(tracker, built_levels)
+        key = (space, steps, die)
+        if key not in self.advice:
+            later = self.best_after(die, self.turns - 1)
+            self.advice[key] = [(option, max(self.worth[landing] + later[landing] for landing in board_landings(option, steps - 1)))
+                                for option in board_forks[space]]
+        return self.advice[key]
+
+    def describe(self, advice):
+        scores = [score for option, score in advice]
+        if (max(scores) == 0):
+            return "Fork advisor: no way picks up cards you need in the next {} turns".format(self.turns)
+        return "Fork advisor, value of the cards you need in the next {} turns: {} ({} looks best)".format(
+            self.turns, ", ".join("{} - {:.0f}".format(number, score) for number, score in enumerate(scores, start=1)), scores.index(max(scores)) + 1)
+
+fork_advisor = ForkAdvisor()
+
+
+LevelDistance = collections.namedtuple("LevelDistance", ["level", "missing", "needed"])
+
+
+def level_distances(inventory, built_levels, max_missing=None, tracker=None):
+    """
+    How far each unbuilt level is from being buildable with inventory, without printing.
+    Returns LevelDistance(level, missing card count, tuple of missing cards in material_list order)
+    in level order, leaving out levels missing more than max_missing cards.
+    With the game's BuildTracker only its distance buckets up to max_missing are visited,
+    otherwise every level is checked against the inventory's slot mask.
+    """
+    built = set(built_levels)
+    held = inventory_mask(inventory)
+    if tracker is not None:
+        last = len(tracker.buckets) if max_missing is None else min(max_missing + 1, len(tracker.buckets))
+        levels = sorted(set().union(*tracker.buckets[:last]) - built)
+    else:
+        levels = [level for level in possible_levels if level not in built]
+    distances = []
+    for level in levels:
+        missing_slots = level_slot_masks[level - 1] & ~held
+        missing = bin(missing_slots).count("1")
+        if (max_missing is None) or (missing <= max_missing):
+            distances.append(LevelDistance(level, missing, missing_cards(level, missing_slots)))
+    return distances
+
+
+@functools.lru_cache(maxsize=8192)
+def missing_cards(level, missing_slots):
+    return tuple(material for slot_bit, material in level_slot_order[level - 1] if missing_slots & slot_bit)
+
+
+def distance(dist, inventory, levels_built, zero_bool, tracker=None, space=None, die=None):
+    #Prints the levels you are {dist} away from building, from level_distances()
+    #With the current space it also says where the nearest space giving each missing card is,
+    #and with the die too it estimates the turns until the missing cards are landed on
+    distances = level_distances(inventory, levels_built, dist, tracker)
     i = 0
     while i <= dist:
         print("{:^{width}}".format("{} away".format(i), width=25))
         print("-------------------------\n")
-        j=0
-        for levels in in_range:
-            num = levels[0]
-            level_name = level_list[num - 1][0]
-            level_mats = material_list[num - 1]
-            req_mats = len(level_mats)
-            
-            if in_range[j][1] == i:
-                needed = []
-                if num != 39 and num != 136:
-                    for mats in level_mats:
-                        if mats not in inventory:
-                            needed.append(mats)
-                else:
-                    for mats in level_mats:
-                        if (mats not in inventory) and (mats != "Boss"):
-                            needed.append(mats)
-                        
-                    if operator.countOf(inventory,'Boss') == 0:
-                        needed.append("Boss")
-                        needed.append("Boss")
-                    elif operator.countOf(inventory,'Boss') == 1:
-                        needed.append("Boss")
-                if (num == 82) or (num == 83) or (num == 84) or (num == 85) or (num == 86) or (num == 87) or (num == 137) or (num == 138) or (num == 139) or (num == 140) or (num == 141) or (num == 142):
+        for level_distance in distances:
+            if level_distance.missing == i:
+                num = level_distance.level
+                level_name = level_table[num - 1].name
+                req_mats = len(material_list[num - 1])
+                if level_table[num - 1].bonus_coin:
                     level_name += " (BC) "
                 if (zero_bool == False) and ((req_mats - i) == 0):
                     pass
                 else:
-                    print("{:^{width}} | Have {}/{}, Need - {}\n".format(level_name, (req_mats - i), req_mats, ", ".join(needed), width=25))
-                        
-            j += 1
+                    needed = level_distance.needed
+                    needed_text = ", ".join(needed)
+                    if (space is not None):
+                        needed_text = ", ".join(describe_supply(card, space) for card in needed)
+                    estimate = ""
+                    board_cards = [card for card in needed if card not in level_earned_cards]
+                    if (space is not None) and (die is not None) and (len(board_cards) != 0):
+                        turns = turn_estimator.expected_turns(space, die, board_cards)
+                        if turns is None:
+                            estimate = " | Over {} turns".format(turn_estimator.max_turns)
+                        else:
+                            estimate = " | About {:.0f} turns".format(turns)
+                    for card in needed:
+                        if card in level_earned_cards:
+                            estimate += " | {} comes from building {}".format(card, level_table[level_earned_cards[card] - 1].name)
+                    print("{:^{width}} | Have {}/{}, Need - {}{}\n".format(level_name, (req_mats - i), req_mats, needed_text, estimate, width=25))
         i += 1
 
+
+
+def describe_supply(card, space):
+    supply = nearest_supply(card, space, 1)
+    if len(supply) == 0:
+        return card
+    return "{} (space {}, {} steps)".format(card, supply[0].space, supply[0].steps)
+
     
 def fill_inventory(inventory):
+    with render_stats.timer("fill_inventory"):
+        draw_inventory(inventory)
+
+
+def draw_inventory(inventory):
     x=0
     y=0
     i=0
@@ -2897,15 +3561,22 @@ def fill_inventory(inventory):
 
         
 def showspace(space, piece_image):
-    board_image = Image.open("assets/Board/dim_board.png")
-    combined_image = board_image.copy()
-    piece_image = Image.open(piece_image)
-    piece_image = piece_image.convert("RGBA") 
-    x_cor_orig = space_coordinates[space-1][0]
-    y_cor_orig = space_coordinates[space-1][1]
-    piece_position = (x_cor_orig, y_cor_orig)
-    combined_image.paste(piece_image, piece_position, piece_image)
-    window.change_main_image(combined_image)        
+    with render_stats.timer("showspace"):
+        combined_image = board_compositor.move_piece(space, piece_image)
+        window.change_main_image(combined_image)        
+
+
+def show_fork_preview(markers):
+    with render_stats.timer("fork_preview"):
+        window.change_main_image(board_compositor.overlay(markers))
+
+
+def show_heatmap(space, die, turns, piece_image, policy=None):
+    # Where the piece could be after turns turns, drawn over the board
+    with render_stats.timer("heatmap"):
+        spread = turn_estimator.spread_after(space, die, turns, policy)
+        window.change_main_image(board_compositor.heatmap(spread, space, piece_image))
+    return spread
 
 def main(window):
     try:
@@ -2916,7 +3587,8 @@ def main(window):
             print("\nTo win, you must build all the levels in DKC1, 2, and 3; Defeat K. Rool 3 times; and rescue 20 Banana Birds")
             print("To build a level, collect all of the material cards for that level")
             
-            window.change_main_image("assets/Board/dim_board.png")
+            board_compositor.set_display_size(window.main_image_size())
+            window.change_main_image(board_compositor.overlay([]))
             
             name_test = False
             while (name_test == False):
@@ -2977,9 +3649,10 @@ def main(window):
             bonus_checklist = []
             money = 2425
             bonus_coin_count = 0
-            token_list = ["Golden Feather", "Camera Piece", "Crystal Coconut", "Banana Bird", "Flipped Bird"]
             built_boss_index = []
             toggles = [["Build Levels", True]]
+            # Turns ahead the board heatmap shows, 0 for just the piece
+            heatmap_turns = 0
             # Togleables
             golden_feathers = False
             b1_test = False
@@ -2987,7 +3660,8 @@ def main(window):
             b3_test = False
             pass_start = False
             #name = "P1"
-            inventory_lists.append([name, []])
+            inventory_lists.append([name, Hand()])
+            build_tracker = BuildTracker(inventory_lists[0][1])
             win = False
             exit_program = False
             message = True
@@ -2996,7 +3670,10 @@ def main(window):
                 
                 print("\nTurn ", current_turn)
                 print("----------\n")
-                showspace(current_space, picture)
+                if (heatmap_turns != 0):
+                    show_heatmap(current_space, die, heatmap_turns, picture)
+                else:
+                    showspace(current_space, picture)
                 roll = dice_roll(die)
                 keeptrue = True
                 if (keeptrue):
@@ -3021,7 +3698,7 @@ def main(window):
                                         zero_bool = True
                                     print("\nLevels that are {} or Less Materials Away\n".format(card_dist))
                             
-                            distance(card_dist, inventory_lists[0][1], built_levels, zero_bool)
+                            distance(card_dist, inventory_lists[0][1], built_levels, zero_bool, build_tracker, current_space, die)
                         elif (choice_checker == "toggle"):
                             valid = False
                             while valid == False:
@@ -3071,7 +3748,7 @@ def main(window):
                             lines = file.readlines()
                             current_turn = int(lines[-9].strip())
                             money = int(lines[-8].strip())
-                            inventory_lists[0][1] = lines[-7].strip().split(", ")
+                            inventory_lists[0][1][:] = lines[-7].strip().split(", ")
                             built_levels = lines[-6].strip().split(", ")
                             curr_lev = 0
                             
@@ -3163,13 +3840,72 @@ def main(window):
                                 
                         elif (choice_checker == "h"):
                             print("")
-                            print("Hidden Options: loadsave-Loads Save Data, loaded-Choose your roll, addl-Manually add Levels, A-Add Inventory\n")
+                            print("Hidden Options: loadsave-Loads Save Data, loaded-Choose your roll, addl-Manually add Levels, A-Add Inventory, RC-Render Cache Stats, RT-Render Timings, P-Build Planner, HM-Landing Heatmap, F-Find Materials\n")
+                        elif (choice_checker == "p"):
+                            print("")
+                            for objective, objective_name in build_objectives.items():
+                                build_plan = plan_builds(inventory_lists[0][1], built_levels, money, bonus_coin_count, objective)
+                                print("{}: {} (${}){}".format(objective_name, describe_plan(build_plan), build_plan.price, "" if build_plan.exact else " (too many options to check them all)"))
+                            print("")
+                        elif (choice_checker == "f"):
+                            supply_names = {material.lower(): material for material in material_supply}
+                            wanted = input("\nWhich materials are you looking for (separate them with commas)\n").lower().split(",")
+                            print("")
+                            for material in wanted:
+                                material = supply_names.get(material.strip())
+                                if material is None:
+                                    print("No space gives that material\n")
+                                    continue
+                                supply = nearest_supply(material, current_space)
+                                turns = turn_estimator.expected_turns(current_space, die, [material])
+                                if turns is None:
+                                    estimate = "Over {} turns".format(turn_estimator.max_turns)
+                                else:
+                                    estimate = "About {:.0f} turns".format(turns)
+                                print("{}: {} | {} to land on one\n".format(material, ", ".join("space {} ({} steps)".format(supply_space.space, supply_space.steps) for supply_space in supply), estimate))
+                        elif (choice_checker == "hm"):
+                            try:
+                                heatmap_turns = int(input("\nHow many turns ahead should the heatmap show (1-10, 0 to turn it off)\n"))
+                                if (heatmap_turns < 0) or (heatmap_turns > 10):
+                                    heatmap_turns = 0
+                                    print("\nInvalid Option\n")
+                            except:
+                                heatmap_turns = 0
+                                print("\nInvalid Option\n")
+                            if (heatmap_turns != 0):
+                                heatmap_spread = show_heatmap(current_space, die, heatmap_turns, picture)
+                                print("\nMost likely spaces in {} turn(s): {}\n".format(heatmap_turns, ", ".join("{} ({:.0%})".format(space, chance) for space, chance in heatmap_spread.most_common(5))))
+                            else:
+                                showspace(current_space, picture)
+                                print("")
+                        elif (choice_checker == "rc"):
+                            print("")
+                            print(render_cache.report())
+                            print("")
+                        elif (choice_checker == "rt"):
+                            print("")
+                            if (render_stats.enabled == False):
+                                render_stats.enabled = True
+                                print("Render timing is on, type RT again to see the results\n")
+                            else:
+                                print(render_stats.report())
+                                timing_choice = input("\nType CSV to save these to render_timings.csv, OFF to stop timing, R to reset, or anything else to keep going\n").lower()
+                                if (timing_choice == "csv"):
+                                    render_stats.write_csv("render_timings.csv")
+                                    print("\nSaved to render_timings.csv\n")
+                                elif (timing_choice == "off"):
+                                    render_stats.enabled = False
+                                    render_stats.reset()
+                                    print("\nRender timing is off\n")
+                                elif (timing_choice == "r"):
+                                    render_stats.reset()
+                                    print("")
                         elif (choice_checker == "bc"):
                             print("\nYou have {} Bonus Coin(s), build some more boss levels to get more\nBonus Coins are required for building levels in the Lost World (82-87), and levels in Krematoa (137-142) (2 per level)\n".format(bonus_coin_count))
                         elif (choice_checker == "bb"):
                             print("\nYou have returned {} Banana Birds so far, you must return {} more to Queen Banana Bird in Cotton-Top Cove\n".format(20-banana_birds_remaining, banana_birds_remaining))
                         elif (choice_checker == 'c'):
-                            if ("Camera Piece" not in inventory_lists[0][1]):
+                            if (inventory_lists[0][1].counts["Camera Piece"] == 0):
                                 print("\nYou have no Camera Pieces\n")
                             else:
                                 print("")
@@ -3185,12 +3921,7 @@ def main(window):
                                         print("\nInvalid Option\n")
                                     else:
                                         inventory_lists[0][1].append(inventory_lists[0][1][cp-1])
-                                        cp_cnt = 0
-                                        for inv in inventory_lists[0][1]:
-                                            if inv == "Camera Piece":
-                                                inventory_lists[0][1].pop(cp_cnt)
-                                                break
-                                            cp_cnt += 1
+                                        inventory_lists[0][1].spend("Camera Piece")
                                         print("")
                                 except:
                                     print("\nInvalid Option\n")
@@ -3217,7 +3948,7 @@ def main(window):
                         elif (choice_checker == "l"):
                             print("")
                             for levels in built_levels:
-                                print(("#" + str(levels)), level_list[levels-1][0])
+                                print(("#" + str(levels)), level_table[levels-1].name)
                             print("")
                         elif (choice_checker == 'r'):
                             print("")
@@ -3242,35 +3973,23 @@ def main(window):
                                     if (b_levels - 1) == c:
                                         l_test = True
                                         break
-                                if (((c+1 == 82) or (c+1 == 83)or (c+1 == 84)or (c+1 == 85)or (c+1 == 86)or (c+1 == 87)or (c+1 == 137)or (c+1 == 138)or (c+1 == 139)or (c+1 == 140)or (c+1 == 141)or (c+1 == 142)) and (l_test == False)):
+                                level_info = level_table[c]
+                                if (level_info.bonus_coin and (l_test == False)):
                                     g_string = "o"
                                 elif l_test == False:
                                     g_string = " "
                                 
                                 else:
                                     g_string = "X"
-                                if c+1 in money_brackets[0]:
-                                    price = 50
-                                elif c+1 in money_brackets[1]:
-                                    price = 100
-                                elif c+1 in money_brackets[2]:
-                                    price = 150
-                                elif c+1 in money_brackets[3]:
-                                    price = 200
-                                elif c+1 in money_brackets[4]:
-                                    price = 250
-                                elif c+1 in money_brackets[5]:
-                                    price = 300
-                                elif c+1 in money_brackets[6]:
-                                    price = 350
-                                bonus_difficulty = bonus_difficulties[c]
+                                price = level_info.price
+                                bonus_difficulty = level_info.bonus_difficulty
                                 if (c+1 in bonus_checklist):
                                     bonus_completion = "!"
                                 else:
                                     bonus_completion = " "
                                 
-                                print(g_string, bonus_completion, ("#" + str(c+1)), levels[0], "|", bonus_difficulty, "|", ", ".join(material_list[c]), "|", "${}".format(price))
-                                if ((c+1 == 6) or (c+1 == 12) or (c+1 == 19) or (c+1 == 26) or (c+1 == 33) or (c+1 == 39) or (c+1 == 40) or (c+1 == 46) or (c+1 == 52) or (c+1 == 59) or (c+1 == 66) or (c+1 == 72) or (c+1 == 79) or (c+1 == 81) or (c+1 == 87) or (c+1 == 93) or (c+1 == 99) or (c+1 == 105) or (c+1 == 111) or (c+1 == 117) or (c+1 == 123) or (c+1 == 130) or (c+1 == 136) or (c+1 == 142)):
+                                print(g_string, bonus_completion, ("#" + str(c+1)), level_info.name, "|", bonus_difficulty, "|", ", ".join(material_list[c]), "|", "${}".format(price))
+                                if (level_info.boss_kind != ""):
                                     print("")
                                 c += 1
                             
@@ -3294,7 +4013,7 @@ def main(window):
                             animals.sort()
                             enviornments.sort()
                             resources.sort()
-                            inventory_lists[0][1] = enviornments + resources + animals
+                            inventory_lists[0][1][:] = enviornments + resources + animals
                         else:
                             
                             choice_checker = "PASS"
@@ -3306,7 +4025,7 @@ def main(window):
                             break
     
                         
-                    level_test = level_check(inventory_lists[0][1], built_levels, bonus_coin_count, money)
+                    level_test = build_tracker.buildable(built_levels, bonus_coin_count)
                     fill_inventory(inventory_lists[0][1])
                     #level test return a list of numbers that correspond to levels able to be build, it then lists buildable levels then runs the test again.
                     if (len(level_test) != 0) and (toggles[0][1] == True):
@@ -3315,8 +4034,15 @@ def main(window):
                             
                             print("\nBuildable Levels\n")
                             for levels in level_test:
-                                print(("#" + str(levels)),level_list[levels-1][0])
+                                print(("#" + str(levels)), level_table[levels-1].name)
                             print("")
+                            if (len(level_test) > 1):
+                                build_plan = plan_builds(inventory_lists[0][1], built_levels, money, bonus_coin_count)
+                                if (len(build_plan.levels) < len(level_test)):
+                                    if (build_plan.exact == True):
+                                        print("These can't all be built together, the most you can build is {} (${})\n".format(describe_plan(build_plan), build_plan.price))
+                                    else:
+                                        print("These can't all be built together, you could build {} (${})\n".format(describe_plan(build_plan), build_plan.price))
                             answer = input("Which level whould you like to build (Enter number of level, or type anything else for no build, Off-Turns this prompt off)\n").lower()
                             try:
                                 answer = int(answer)
@@ -3339,7 +4065,7 @@ def main(window):
                                 else:
                                     print("Invalid Option")
                                 fill_inventory(inventory_lists[0][1])
-                                level_test = level_check(inventory_lists[0][1], built_levels, bonus_coin_count, money)
+                                level_test = build_tracker.buildable(built_levels, bonus_coin_count)
                                 fill_inventory(inventory_lists[0][1])
                                 if (len(level_test) == 0):
                                     break
@@ -3358,7 +4084,7 @@ def main(window):
                     print("")
                 
                     
-                if ("Golden Feather" in inventory_lists[0][1]):
+                if (inventory_lists[0][1].counts["Golden Feather"] != 0):
                     tfc = False
                     found = False
                     for toggle in toggles:
@@ -3376,14 +4102,7 @@ def main(window):
                     if tfc == True:
                         gf_use = input("Would you like to use a Golden Feather (Yes to use, anything else for no, Off to toggle GF off)\n").lower()
                         if (gf_use == 'm'):
-                            board_image = Image.open("assets/Board/dim_board.png")
-                            piece_image = Image.open(picture)
-                            piece_image = piece_image.convert("RGBA")
-                            x_cor = space_coordinates[current_space - 1][0]
-                            y_cor = space_coordinates[current_space - 1][1]
-                            piece_position = (x_cor, y_cor)  # Replace with your desired coordinates (x, y)
-                            combined_image = board_image.copy()
-                            combined_image.paste(piece_image, piece_position, piece_image)
+                            combined_image = board_compositor.move_piece(current_space, picture)
                             window.change_main_image(combined_image)
                             gf_use = input("Would you like to use a Golden Feather (Yes to use, anything else for no)\n").lower()
                         if (gf_use == "off"):
@@ -3404,20 +4123,14 @@ def main(window):
                                         valid = False
                                     else:
                                         roll = roll + gf
-                                        gf_cnt = 0
-                                        for inv in inventory_lists[0][1]:
-                                            if inv == "Golden Feather":
-                                                inventory_lists[0][1].pop(gf_cnt)
-                                                valid = True
-                                                break
-                                            gf_cnt += 1
+                                        valid = inventory_lists[0][1].spend("Golden Feather")
                                         print("")
                                     
                                 except:
                                     print("\nInvalid Option\n")
                 if (exit_program == True):
                     break
-                result = determine_space(current_space, roll, built_levels, krool_counter, banana_birds_remaining, picture)
+                result = determine_space(current_space, roll, built_levels, krool_counter, banana_birds_remaining, picture, build_tracker, die)
                 current_space, pass_start = result
                 showspace(current_space, picture)
                 if (pass_start == True) and (current_space !=6) and (current_turn != 1):
@@ -3429,16 +4142,11 @@ def main(window):
                     break
                 if (current_space == 4):
                     if (banana_birds_remaining != 0):
-                        while (("Banana Bird" or "Flipped Bird") in inventory_lists[0][1]) and (banana_birds_remaining != 0):
+                        while (inventory_lists[0][1].counts["Banana Bird"] != 0) and (banana_birds_remaining != 0):
                             b_test = input("Would you like to release a Banana Bird (Yes or No)").lower()
                             if (b_test == "yes"):
-                                bb_cnt = 0
-                                for inv in inventory_lists[0][1]:
-                                    if inv == ("Banana Bird" or "Flipped Bird"):
-                                        inventory_lists[0][1].pop(bb_cnt)
-                                        banana_birds_remaining -= 1
-                                        break
-                                    bb_cnt += 1
+                                inventory_lists[0][1].spend("Banana Bird")
+                                banana_birds_remaining -= 1
                                 print("")
                             else:
                                 break
@@ -3597,7 +4305,7 @@ def main(window):
                         print(cards)
                     print("")
                 
-                level_test = level_check(inventory_lists[0][1], built_levels, bonus_coin_count, money)
+                level_test = build_tracker.buildable(built_levels, bonus_coin_count)
                 #level test return a list of numbers that correspond to levels able to be build, it then lists buildable levels then runs the test again.
                 if (len(level_test) != 0) and (toggles[0][1] == True):
                     cont_test = True
@@ -3605,8 +4313,15 @@ def main(window):
                         
                         print("\nBuildable Levels\n")
                         for levels in level_test:
-                            print(("#" + str(levels)),level_list[levels-1][0])
+                            print(("#" + str(levels)), level_table[levels-1].name)
                         print("")
+                        if (len(level_test) > 1):
+                            build_plan = plan_builds(inventory_lists[0][1], built_levels, money, bonus_coin_count)
+                            if (len(build_plan.levels) < len(level_test)):
+                                if (build_plan.exact == True):
+                                    print("These can't all be built together, the most you can build is {} (${})\n".format(describe_plan(build_plan), build_plan.price))
+                                else:
+                                    print("These can't all be built together, you could build {} (${})\n".format(describe_plan(build_plan), build_plan.price))
                         answer = input("Which level whould you like to build (Enter number of level, or type anything else for no build (Typing Off turns off this prompt))\n").lower()
                         try:
                             answer = int(answer)
@@ -3621,42 +4336,27 @@ def main(window):
                                             break
                                         curr_card += 1
                                 levels = answer
-                                if (levels == 82) or (levels == 83) or (levels == 84) or (levels == 85) or (levels == 86) or (levels == 87) or (levels == 137) or (levels == 138) or (levels == 139) or (levels == 140) or (levels == 141) or (levels == 142):  
+                                level_info = level_table[levels-1]
+                                if level_info.bonus_coin:
                                     bonus_coin_count -= 2
-                                if levels in money_brackets[0]:
-                                    money -= 50
-                                elif levels in money_brackets[1]:
-                                    money -= 100
-                                elif levels in money_brackets[2]:
-                                    money -= 150
-                                elif levels in money_brackets[3]:
-                                    money -= 200
-                                elif levels in money_brackets[4]:
-                                    money -= 250
-                                elif levels in money_brackets[5]:
-                                    money -= 300
-                                elif levels in money_brackets[6]:
-                                    money -= 350
+                                money -= level_info.price
                                 print("\nSuccessfully Built\n")
                                 
-                                if (levels not in regular_boss_levels) and (levels not in final_boss_levels):
+                                if (level_info.boss_kind == ""):
                                 
-                                    input("Roll for the Bonus, you need a {} to succeed\n".format(bonus_difficulties[levels-1]))
+                                    input("Roll for the Bonus, you need a {} to succeed\n".format(level_info.bonus_difficulty))
                                     bonus_roll = dice_roll(6)
-                                    if (bonus_roll >= bonus_difficulties[levels-1]):
+                                    if (bonus_roll >= level_info.bonus_difficulty):
                                         bonus_check = "Success"
                                         bonus_checklist.append(levels)
                                     else:
-                                        if ("Banana Bird" in inventory_lists[0][1]):
+                                        if (inventory_lists[0][1].counts["Banana Bird"] != 0):
                                             bb_ask = input("You failed the bonus roll with a roll of only a {}, would you like to use a Banana Bird to increase your roll by 1 or 2 (Yes or No)".format(bonus_roll)).lower()
                                             if (bb_ask == "yes"):
                                                 bonus_roll += 2
-                                                for inv in inventory_lists[0][1]:
-                                                    if inv == "Banana Bird":
-                                                        inventory_lists[0][1].pop(bb_cnt)
-                                                        inventory_lists[0][1].append("Flipped Bird")
-                                                        break
-                                                if (bonus_roll >= bonus_difficulties[levels-1]):
+                                                inventory_lists[0][1].spend("Banana Bird")
+                                                inventory_lists[0][1].append("Flipped Bird")
+                                                if (bonus_roll >= level_info.bonus_difficulty):
                                                     bonus_check = "Success"
                                                     bonus_checklist.append(levels)
                                                 else:
@@ -3667,23 +4367,20 @@ def main(window):
                                             bonus_check = "Failure"
                                         
                                     print("You rolled a {}, {}!".format(str(bonus_roll), bonus_check))
-                                elif (levels in regular_boss_levels):
-                                    input("Roll to beat the boss, you need a {} to succeed\n".format(bonus_difficulties[levels-1]))
+                                elif (level_info.boss_kind == "boss"):
+                                    input("Roll to beat the boss, you need a {} to succeed\n".format(level_info.bonus_difficulty))
                                     boss_roll = dice_roll(6)
-                                    if (boss_roll >= bonus_difficulties[levels-1]):
+                                    if (boss_roll >= level_info.bonus_difficulty):
                                         bonus_check = "Success"
                                         bonus_checklist.append(levels)
                                     else:
-                                        if ("Banana Bird" in inventory_lists[0][1]):
+                                        if (inventory_lists[0][1].counts["Banana Bird"] != 0):
                                             bb_ask = input("You failed the boss roll with a roll of only a {}, would you like to use a Banana Bird to increase your roll by 1 or 2 (Yes or No)".format(bonus_roll)).lower()
                                             if (bb_ask == "yes"):
                                                 boss_roll += 2
-                                                for inv in inventory_lists[0][1]:
-                                                    if inv == "Banana Bird":
-                                                        inventory_lists[0][1].pop(bb_cnt)
-                                                        inventory_lists[0][1].append("Flipped Bird")
-                                                        break
-                                                if (boss_roll >= bonus_difficulties[levels-1]):
+                                                inventory_lists[0][1].spend("Banana Bird")
+                                                inventory_lists[0][1].append("Flipped Bird")
+                                                if (boss_roll >= level_info.bonus_difficulty):
                                                     bonus_check = "Success"
                                                     bonus_checklist.append(levels)
                                                 else:
@@ -3725,7 +4422,7 @@ def main(window):
                                     print(cards)
                             else:
                                 print("Invalid Option")
-                            level_test = level_check(inventory_lists[0][1], built_levels, bonus_coin_count, money)
+                            level_test = build_tracker.buildable(built_levels, bonus_coin_count)
                             if (len(level_test) == 0):
                                 break
                         except:
@@ -3860,11 +4557,7 @@ def main(window):
                         built_boss_index.append(136)
                         print("\n2 Bonus Coins Added\n")
                         bonus_coin_count += 1
-                bb_count = operator.countOf(inventory_lists[0][1],'Banana Bird')
-                gf_count = operator.countOf(inventory_lists[0][1],'Golden Feather')
-                cp_count = operator.countOf(inventory_lists[0][1],'Camera Piece')
-                cc_count = operator.countOf(inventory_lists[0][1],'Crystal Coconut')
-                token_count = bb_count + gf_count + cc_count + cp_count
+                token_count = inventory_lists[0][1].token_count()
                 curr_inventory_size = len(inventory_lists[0][1])
                 while (token_count > token_inventory):
                     print("You can only have", token_inventory, "tokens in your hand, choose one to discard")
@@ -3872,7 +4565,7 @@ def main(window):
                     t_test = False
                     curr_card = 1
                     for token in (inventory_lists[0][1]):
-                        if (token == "Golden Feather") or (token == "Crystal Coconut") or (token == "Camera Piece") or (token == "Banana Bird"):
+                        if (token in limited_tokens):
                             print("#", curr_card, " ", token)
                         curr_card += 1
                     print("")
@@ -3886,7 +4579,7 @@ def main(window):
                         except:
                             print("INVALID CHOICE")
                     inventory_lists[0][1].pop(choice-1)
-                    token_count -= 1
+                    token_count = inventory_lists[0][1].token_count()
                     print("")
                 curr_inventory_size = len(inventory_lists[0][1])
                 while curr_inventory_size > char_inv:
@@ -3896,6 +4589,9 @@ def main(window):
                     for o_cards in (inventory_lists[0][1]):
                         print("#", curr_card, " ", o_cards)
                         curr_card += 1
+                    discard_ranks = rank_discards(build_tracker, built_levels)
+                    if (len(discard_ranks) != 0):
+                        print("\nSuggested discards (least useful first):", ", ".join("#{} {}".format(position, card) for position, card, cost in discard_ranks[:3]))
                     ch_test = False
                     while (ch_test == False):
                         try:
@@ -3970,14 +4666,10 @@ def main(window):
                     if (message == True):
                         print("\nYou have built all the levels and beaten K. Rool 3 times, head to the finish space")
                         message = False
-                bb_count = operator.countOf(inventory_lists[0][1],'Banana Bird')
-                gf_count = operator.countOf(inventory_lists[0][1],'Golden Feather')
-                cp_count = operator.countOf(inventory_lists[0][1],'Camera Piece')
-                cc_count = operator.countOf(inventory_lists[0][1],'Crystal Coconut')
-                money += ((bb_count * 20) + (gf_count * 20) + (cp_count * 20) + (cc_count * 20))
-                token_count = bb_count + gf_count + cc_count + cp_count
+                token_count = inventory_lists[0][1].token_count()
+                money += token_count * token_income
                 if (token_count > 0):
-                    print("You earned ${} from your {} token(s) this turn\n".format(((bb_count * 20) + (gf_count * 20) + (cp_count * 20) + (cc_count * 20)), token_count))
+                    print("You earned ${} from your {} token(s) this turn\n".format(token_count * token_income, token_count))
                 current_turn += 1
                 previous_space = current_space
                 file.write(str(current_turn))
@@ -4039,6 +4731,9 @@ def main(window):
         print("Program execution complete.")
 
 if __name__ == "__main__":
+    if "--build-atlas" in sys.argv:
+        build_card_atlas()
+        sys.exit()
     app = QApplication([])
     window = MainWindow()
     window.show()
@@ -0,0 +1,18 @@
+import importlib.util
+import os
+
+import pytest
+
+script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "DKCBG Seperate Window Playable.py")
+
+
+@pytest.fixture(scope="session")
+def dk(tmp_path_factory):
+    # The game script imported as a module, run from a scratch directory so the caches it writes stay out of assets
+    start = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("play"))
+    spec = importlib.util.spec_from_file_location("dkcbg", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    os.chdir(start)
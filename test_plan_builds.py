@@ -0,0 +1,86 @@
+import itertools
+import random
+
+import pytest
+
+
+def brute_force(dk, inventory, built_levels, money, bonus_coin_count, objective):
+    # (score, levels, -price) of the best set, trying every subset of the buildable levels
+    candidates = dk.level_check(inventory, built_levels, bonus_coin_count, money)
+    counts = dk.inventory_counts(inventory)
+    built = set(built_levels)
+    best = None
+    for size in range(len(candidates) + 1):
+        for levels in itertools.combinations(candidates, size):
+            if dk.spend_levels(levels, counts, money, bonus_coin_count) is None:
+                continue
+            if (objective == "count"):
+                score = size
+            elif (objective == "bonus"):
+                score = sum(dk.bonus_coin_awards.get(level, 0) for level in levels)
+            else:
+                score = 0
+                for world in set(dk.level_table[level - 1].world for level in candidates):
+                    unbuilt = set(level for level in dk.possible_levels if (dk.level_table[level - 1].world == world) and (level not in built))
+                    score += unbuilt <= set(levels)
+            key = (score, size, -sum(dk.level_table[level - 1].price for level in levels))
+            if (best is None) or (key > best):
+                best = key
+    return best
+
+
+def random_hands(dk, rng, count):
+    # (inventory, built levels, money, Bonus Coins) with 4 to 12 buildable levels, few enough to brute force
+    while count:
+        inventory = [rng.choice(dk.name_list) for _ in range(rng.randint(10, 50))]
+        built_levels = rng.sample(dk.possible_levels, rng.randint(0, 130))
+        money = rng.randint(0, 1500)
+        bonus_coin_count = rng.randint(0, 6)
+        if 4 <= len(dk.level_check(inventory, built_levels, bonus_coin_count, money)) <= 12:
+            yield inventory, built_levels, money, bonus_coin_count
+            count -= 1
+
+
+@pytest.mark.parametrize("objective", ["count", "bonus", "world"])
+def test_plan_builds_matches_brute_force(dk, objective):
+    for hand in random_hands(dk, random.Random(5), 150):
+        plan = dk.plan_builds(*hand, objective)
+        assert plan.exact
+        assert (plan.score, len(plan.levels), -plan.price) == brute_force(dk, *hand, objective)
+
+
+@pytest.mark.parametrize("objective", ["count", "bonus", "world"])
+def test_plan_builds_falls_back_to_a_set_that_fits(dk, monkeypatch, objective):
+    # With hardly any states allowed the greedy pick is used, it must fit and can't beat the optimum
+    monkeypatch.setattr(dk, "plan_state_limit", 5)
+    inexact = 0
+    for inventory, built_levels, money, bonus_coin_count in random_hands(dk, random.Random(7), 100):
+        plan = dk.plan_builds(inventory, built_levels, money, bonus_coin_count, objective)
+        inexact += not plan.exact
+        assert set(plan.levels) <= set(dk.level_check(inventory, built_levels, bonus_coin_count, money))
+        assert dk.spend_levels(plan.levels, dk.inventory_counts(inventory), money, bonus_coin_count) is not None
+        assert (plan.score, len(plan.levels), -plan.price) <= brute_force(dk, inventory, built_levels, money, bonus_coin_count, objective)
+    assert inexact
+
+
+def one_level_per_world(dk, rng):
+    # A hand holding exactly the cards for one unbuilt level in every world
+    worlds = {}
+    for level in dk.possible_levels:
+        if not dk.level_table[level - 1].bonus_coin:
+            worlds.setdefault(dk.level_table[level - 1].world, []).append(level)
+    unbuilt = [rng.choice(levels) for levels in worlds.values()]
+    inventory = []
+    for level in unbuilt:
+        for material_id, count in enumerate(dk.level_requirements[level - 1]):
+            inventory += [dk.name_list[material_id]] * count
+    return inventory, [level for level in dk.possible_levels if level not in unbuilt]
+
+
+def test_plan_builds_world_gives_up_on_too_many_combinations(dk):
+    # 23 finishable worlds and money for 3: trying every combination used to run for minutes
+    inventory, built_levels = one_level_per_world(dk, random.Random(1))
+    plan = dk.plan_builds(inventory, built_levels, 150, 10, "world")
+    assert not plan.exact
+    assert plan.score == len(plan.levels) == 3
+    assert dk.spend_levels(plan.levels, dk.inventory_counts(inventory), 150, 10) is not None
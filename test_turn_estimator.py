@@ -0,0 +1,78 @@
+import collections
+import random
+
+import pytest
+
+
+def turn_by_turn(copies, chances_for_turn, tolerance=1e-13):
+    # Expected turns summed one turn at a time until everything is done to within tolerance
+    copies = {material: list(counts) for material, counts in copies.items()}
+    expected = 0.0
+    turn = 0
+    while True:
+        done = 1.0
+        for counts in copies.values():
+            done *= counts[-1]
+        if (1 - done < tolerance):
+            return expected
+        expected += 1 - done
+        chances = chances_for_turn(turn)
+        for material, counts in copies.items():
+            hit = chances.get(material, 0.0)
+            for index in range(len(counts) - 1, 0, -1):
+                counts[index] = counts[index] * (1 if index == len(counts) - 1 else 1 - hit) + counts[index - 1] * hit
+            counts[0] *= 1 - hit
+        turn += 1
+
+
+def test_tail_turns_matches_turn_by_turn(dk):
+    rng = random.Random(3)
+    for _ in range(200):
+        chances = {}
+        copies = {}
+        for material in rng.sample(sorted(dk.material_supply), rng.randint(1, 4)):
+            chances[material] = rng.uniform(0.02, 0.4)
+            need = rng.randint(1, 3)
+            # A spread over how many copies are held so far, like expected_turns() hands over
+            weights = [rng.random() for _ in range(need + 1)]
+            copies[material] = [weight / sum(weights) for weight in weights]
+        expected = turn_by_turn(copies, lambda turn: chances)
+        assert dk.turn_estimator.tail_turns(copies, chances) == pytest.approx(expected, rel=1e-9)
+
+
+def test_expected_turns_matches_turn_by_turn(dk):
+    estimator = dk.TurnEstimator()
+    rng = random.Random(2)
+    for level in rng.sample(dk.possible_levels, 30):
+        needed = [material for material in dk.material_list[level - 1] if material in dk.material_supply]
+        space = rng.choice(dk.board_spaces)
+        die = rng.choice([8, 10, 20])
+        per_turn, long_run = estimator.hit_curves(space, die)
+        copies = {material: [1.0] + [0.0] * count for material, count in collections.Counter(needed).items()}
+        expected = turn_by_turn(copies, lambda turn: per_turn[turn] if turn < len(per_turn) else long_run)
+        assert estimator.expected_turns(space, die, needed) == pytest.approx(expected, rel=1e-6)
+
+
+def test_expected_turns_matches_a_random_walk(dk):
+    # Two copies of one material, so the estimate doesn't lean on materials being independent
+    estimator = dk.TurnEstimator()
+    rng = random.Random(4)
+    space, die, material = 6, 10, "Water"
+    table = estimator.landing_table(die)
+    supply = set(dk.material_supply[material])
+    walks = 4000
+    total = 0
+    for _ in range(walks):
+        current, held, turns = space, 0, 0
+        while held < 2:
+            landings = table[current]
+            current = rng.choices(list(landings), weights=list(landings.values()))[0]
+            held += current in supply
+            turns += 1
+        total += turns
+    assert estimator.expected_turns(space, die, [material, material]) == pytest.approx(total / walks, rel=0.06)
+
+
+def test_expected_turns_is_none_for_cards_no_space_gives(dk):
+    for card in dk.level_earned_cards:
+        assert dk.turn_estimator.expected_turns(6, 10, [card]) is None